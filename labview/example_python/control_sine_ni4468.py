@@ -23,8 +23,11 @@ def compute_N_and_samplerate(freq, device_max=DEVICE_MAX):
 def generate_buffer(freq, amplitude=AMPLITUDE, device_max=DEVICE_MAX, cycles=CYCLES_IN_BUFFER):
     N, sr = compute_N_and_samplerate(freq, device_max)
     buffer_samples = N * cycles
-    t = np.arange(buffer_samples) / sr
-    buffer = amplitude * np.sin(2 * np.pi * freq * t)
+    # sr = freq * N, so the phase step per sample is exactly 2*pi/N
+    buffer = np.arange(buffer_samples, dtype=np.float64)
+    buffer *= 2 * math.pi / N
+    np.sin(buffer, out=buffer)
+    buffer *= amplitude
     return buffer, N, sr
 
 if __name__ == '__main__':
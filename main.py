@@ -5,9 +5,14 @@ Supports 4 cards (SV1-SV4) with per-channel amplitude control in microvolts.
 
 import nidaqmx
 import nidaqmx.system
+from nidaqmx.stream_readers import AnalogMultiChannelReader
 import numpy as np
 import time
 import csv
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import gcd
 import tkinter as tk
 from tkinter import ttk, messagebox
 from threading import Thread, Event, Lock
@@ -20,6 +25,49 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
 
+_TWO_PI = 2.0 * np.pi
+_EMPTY_SCOPE = np.empty(0, dtype=np.float32)
+_EMPTY_SCOPE.flags.writeable = False
+
+
+def _rms_peak(data: np.ndarray) -> tuple:
+    """
+    Return per-row (rms, peak) arrays of a (channels x samples) block.
+    
+    Uses row reductions only: einsum fuses the square and the sum, and the
+    peak comes from the row max and min, so no full-size temporary is built.
+    """
+    rms = np.sqrt(np.einsum('ij,ij->i', data, data) / data.shape[1])
+    peak = np.maximum(-data.min(axis=1), data.max(axis=1))
+    return rms, peak
+
+
+def _minmax_starts(num_samples: int, buckets: int) -> np.ndarray:
+    """First sample index of each of buckets near-equal buckets covering all samples."""
+    return np.linspace(0, num_samples, buckets + 1).astype(np.intp)[:-1]
+
+
+def _minmax_decimate(y: np.ndarray, starts: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Reduce a trace to a (min, max) pair per bucket for drawing.
+    
+    Keeps the visual envelope of the signal while cutting the number of
+    points handed to matplotlib to 2 * len(starts). Buckets begin at starts
+    (see _minmax_starts), so every sample is covered. Writes into out if given.
+    """
+    if out is None:
+        out = np.empty(2 * len(starts), dtype=y.dtype)
+    np.minimum.reduceat(y, starts, out=out[0::2])
+    np.maximum.reduceat(y, starts, out=out[1::2])
+    return out
+
+
+def _minmax_time(t: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Time axis matching _minmax_decimate: each pair spans its bucket's first to last sample."""
+    ends = np.append(starts[1:], len(t)) - 1
+    return np.column_stack((t[starts], t[ends])).ravel()
+
+
 @dataclass
 class FrequencyOption:
     """Represents a frequency option from the CSV file."""
@@ -29,18 +77,49 @@ class FrequencyOption:
     enabled: bool = False
 
 
-@dataclass
 class ChannelConfig:
-    """Configuration for a single output channel."""
-    card_name: str
-    channel_number: int  # 0-7 for PXIe-4468
-    amplitude_uv: float = 1000.0  # microvolts
-    enabled: bool = True
+    """
+    Configuration for a single output channel.
+    
+    A view onto one slot of MultiCardGenerator's per-channel arrays, so the
+    GUI keeps an object per channel while the generator works on the arrays.
+    """
+    __slots__ = ('card_name', 'channel_number', '_generator', '_index')
+    
+    def __init__(self, generator: 'MultiCardGenerator', index: int):
+        self._generator = generator
+        self._index = index
+        self.card_name = generator.CARD_NAMES[generator._card_idx[index]]
+        self.channel_number = int(generator._ch_num[index])  # 0-1 for PXIe-4468
+    
+    @property
+    def amplitude_uv(self) -> float:
+        """Amplitude in microvolts."""
+        return float(self._generator._amp_uv[self._index])
+    
+    @amplitude_uv.setter
+    def amplitude_uv(self, value: float):
+        self._generator._amp_uv[self._index] = value
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self._generator._enabled[self._index])
+    
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._generator._enabled[self._index] = value
+    
+    def __repr__(self):
+        return (f"ChannelConfig(card_name={self.card_name!r}, channel_number={self.channel_number}, "
+                f"amplitude_uv={self.amplitude_uv}, enabled={self.enabled})")
 
 
 class FrequencyManager:
     """Manages loading and selection of frequencies from CSV."""
     
+    # Common sample rates, ascending (must not exceed the 200 kS/s AO limit)
+    COMMON_SAMPLE_RATES = (1000, 2500, 5000, 10000, 25000, 50000, 100000, 200000)
+    
     def __init__(self, csv_path: str = "frequencies.CSV"):
         self.csv_path = csv_path
         self.frequencies: List[FrequencyOption] = []
@@ -49,14 +128,21 @@ class FrequencyManager:
     def load_frequencies(self):
         """Load frequencies from CSV file."""
         try:
-            with open(self.csv_path, 'r') as f:
-                reader = csv.DictReader(f)
+            with open(self.csv_path, 'r', newline='') as f:
+                reader = csv.reader(f)
+                # Resolve column positions once; rows are then plain lists
+                header = [name.strip() for name in next(reader)]
+                freq_col = header.index('Frequency')
+                name_col = header.index('Name') if 'Name' in header else None
+                avail_col = header.index('Available') if 'Available' in header else None
+                enabled_col = header.index('Enabled') if 'Enabled' in header else None
+                
                 for row in reader:
                     try:
-                        freq = float(row['Frequency'])
-                        name = row.get('Name', f"{freq} Hz")
-                        available = row.get('Available', '').strip().upper() == 'X'
-                        enabled = row.get('Enabled', '').strip().upper() == 'X'
+                        freq = float(row[freq_col])
+                        name = row[name_col] if name_col is not None else f"{freq} Hz"
+                        available = avail_col is not None and row[avail_col].strip() in ('X', 'x')
+                        enabled = enabled_col is not None and row[enabled_col].strip() in ('X', 'x')
                         
                         self.frequencies.append(FrequencyOption(
                             frequency=freq,
@@ -64,7 +150,7 @@ class FrequencyManager:
                             available=available,
                             enabled=enabled
                         ))
-                    except (ValueError, KeyError):
+                    except (ValueError, IndexError):
                         continue
         except Exception as e:
             print(f"Error loading frequencies from {self.csv_path}: {e}")
@@ -81,11 +167,14 @@ class FrequencyManager:
         """Get list of available frequencies."""
         return [f for f in self.frequencies if f.available or f.enabled]
     
-    def calculate_sample_rate(self, frequency: float) -> int:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def calculate_sample_rate(frequency: float) -> int:
         """
         Calculate optimal sample rate for a given frequency.
         Ensures at least 100 samples per cycle, rounds to nice values.
         PXIe-4468 AO maximum: 200 kS/s, AI maximum: 250 kS/s
+        Pure function of frequency, so results are memoized.
         """
         # Hardware limit for PXIe-4468 analog outputs
         MAX_SAMPLE_RATE = 200000  # 200 kS/s for AO
@@ -98,12 +187,11 @@ class FrequencyManager:
         if base_rate > MAX_SAMPLE_RATE:
             return MAX_SAMPLE_RATE
         
-        # Round to common sample rates (must not exceed MAX_SAMPLE_RATE)
-        common_rates = [1000, 2500, 5000, 10000, 25000, 50000, 100000, 200000]
-        
-        for rate in common_rates:
-            if rate >= base_rate:
-                return rate
+        # Round up to the nearest common sample rate
+        rates = FrequencyManager.COMMON_SAMPLE_RATES
+        index = bisect_left(rates, base_rate)
+        if index < len(rates):
+            return rates[index]
         
         # Fallback to maximum
         return MAX_SAMPLE_RATE
@@ -116,51 +204,89 @@ class MultiCardGenerator:
     CARD_NAMES = ["SV1", "SV2", "SV3", "SV4"]
     MAX_AO_SAMPLE_RATE = 200000  # AO (output) limit: 200 kS/s
     MAX_AI_SAMPLE_RATE = 250000  # AI (input) limit: 250 kS/s
+    WAVE_CACHE_SLOTS = 16  # Unit sine tables kept across frequency changes
     
     def __init__(self):
         self.ao_tasks: Dict[str, nidaqmx.Task] = {}  # Analog output tasks
+        self.ao_buffers: Dict[str, np.ndarray] = {}  # Per-task (channels x samples) waveforms
+        self._card_state: Dict[str, tuple] = {}  # Per-task (freq, srate, amplitudes_uv) last written
         self.ai_tasks: Dict[str, nidaqmx.Task] = {}  # Analog input tasks
+        self.ai_readers: Dict[str, AnalogMultiChannelReader] = {}  # Stream readers for ai_tasks
+        self.ai_buffers: Dict[str, np.ndarray] = {}  # Per-task (channels x samples) read buffers
         self.lock = Lock()
         self.running = False
         self.stop_event = Event()
+        self._config_dirty = Event()  # Set by the setters to wake the output worker
         
         # Current configuration
         self.frequency = 1000.0  # Hz
         self.sample_rate = 100000  # Hz (for AO output)
         self.ai_sample_rate = self.MAX_AI_SAMPLE_RATE  # Always use max for AI (oscilloscope: 250kS/s)
         self.channels: List[ChannelConfig] = []
+        self._channel_index: Dict[tuple, ChannelConfig] = {}  # (card_name, channel_number) -> config
         
-        # Input data storage (RMS and peak per channel)
-        self.input_data: Dict[str, Dict[str, float]] = {}  # {"SV1_0": {"rms": 0.0, "peak": 0.0}}
+        # Unit-amplitude gap-free sine buffers, keyed by (samples, cycles).
+        # Only a handful of CSV frequencies are selectable, so tables survive
+        # frequency changes; the oldest is dropped past WAVE_CACHE_SLOTS
+        self._wave_cache: Dict[tuple, np.ndarray] = {}
         
-        # Oscilloscope waveform buffer (stores last N samples for each channel)
+        # Published scope snapshots: {"SV1_0": scope samples}. The worker
+        # replaces whole arrays (a single GIL-atomic dict store) and never
+        # mutates a published one, so readers need no lock
+        self._scope_snapshot: Dict[str, np.ndarray] = {}
+        
+        # Oscilloscope waveform buffer (stores last N samples for each channel).
+        # The circular buffers are private to the worker thread
         self.scope_buffer_size = 5000  # Number of samples to store
-        self.scope_data: Dict[str, np.ndarray] = {}  # {"SV1_0": array of samples}
-        
-        # Initialize all channels for all cards (disabled by default)
-        for card_name in self.CARD_NAMES:
-            for ch in range(self.CHANNELS_PER_CARD):
-                self.channels.append(ChannelConfig(
-                    card_name=card_name,
-                    channel_number=ch,
-                    amplitude_uv=1000.0,
-                    enabled=False
-                ))
+        self._scope_ring: Dict[str, np.ndarray] = {}  # {"SV1_0": circular buffer of samples}
+        self._scope_write_idx: Dict[str, int] = {}  # Next write position in each circular buffer
+        self._scope_fill: Dict[str, int] = {}  # Valid samples in each buffer (up to scope_buffer_size)
+        # Open oscilloscope windows per channel index; scope buffers are only
+        # fed for watched channels, and measurements only for watched or
+        # enabled (metered) ones
+        self._scope_subscribers = np.zeros(len(self.CARD_NAMES) * self.CHANNELS_PER_CARD, dtype=np.int32)
+        
+        # Channel state as parallel arrays; channel i is channel number
+        # i % CHANNELS_PER_CARD on card i // CHANNELS_PER_CARD
+        num_channels = len(self.CARD_NAMES) * self.CHANNELS_PER_CARD
+        self._amp_uv = np.full(num_channels, 1000.0)  # microvolts
+        self._enabled = np.zeros(num_channels, dtype=bool)  # Disabled by default
+        self._card_idx = np.repeat(np.arange(len(self.CARD_NAMES), dtype=np.int8), self.CHANNELS_PER_CARD)
+        self._ch_num = np.tile(np.arange(self.CHANNELS_PER_CARD, dtype=np.int8), len(self.CARD_NAMES))
+        self._card_slices = {card_name: slice(i * self.CHANNELS_PER_CARD, (i + 1) * self.CHANNELS_PER_CARD)
+                             for i, card_name in enumerate(self.CARD_NAMES)}
+        self._input_index = {f"{card_name}_{ch}": i * self.CHANNELS_PER_CARD + ch
+                             for i, card_name in enumerate(self.CARD_NAMES)
+                             for ch in range(self.CHANNELS_PER_CARD)}  # "SV1_0" -> channel index
+        
+        # Input measurements per channel index, written a card slice at a time
+        self._rms = np.zeros(num_channels)
+        self._peak = np.zeros(num_channels)
+        
+        # Initialize all channels for all cards
+        for index in range(num_channels):
+            config = ChannelConfig(self, index)
+            self.channels.append(config)
+            self._channel_index[(config.card_name, config.channel_number)] = config
+        
+        # Immutable snapshots for the output worker, replaced wholesale under
+        # the lock by the setters and read without it
+        self._freq_srate = (self.frequency, self.sample_rate)
+        self._enabled_snapshot = (self._enabled.copy(), np.zeros(num_channels))  # (enabled, amplitudes_uv, 0 if disabled)
         
         self.output_thread = None
     
     def get_channel(self, card_name: str, channel_number: int) -> Optional[ChannelConfig]:
         """Get configuration for a specific channel."""
-        for ch in self.channels:
-            if ch.card_name == card_name and ch.channel_number == channel_number:
-                return ch
-        return None
+        return self._channel_index.get((card_name, channel_number))
     
     def set_frequency(self, frequency: float, sample_rate: int):
         """Set the output frequency and sample rate for all channels."""
         with self.lock:
             self.frequency = frequency
             self.sample_rate = sample_rate
+            self._freq_srate = (frequency, sample_rate)
+        self._config_dirty.set()
     
     def set_channel_amplitude(self, card_name: str, channel_number: int, amplitude_uv: float):
         """Set amplitude for a specific channel in microvolts."""
@@ -168,6 +294,8 @@ class MultiCardGenerator:
         if channel:
             with self.lock:
                 channel.amplitude_uv = amplitude_uv
+                self._rebuild_enabled_snapshot()
+            self._config_dirty.set()
     
     def set_channel_enabled(self, card_name: str, channel_number: int, enabled: bool):
         """Enable or disable a specific channel."""
@@ -175,16 +303,61 @@ class MultiCardGenerator:
         if channel:
             with self.lock:
                 channel.enabled = enabled
+                self._rebuild_enabled_snapshot()
+            self._config_dirty.set()
     
-    def generate_sinewave(self, frequency: float, amplitude_v: float, sample_rate: int) -> np.ndarray:
-        """Generate one period of a sine wave."""
-        period = 1.0 / frequency
-        num_samples = int(sample_rate * period)
-        # Ensure at least 2 samples
-        if num_samples < 2:
-            num_samples = 2
-        t = np.linspace(0, period, num_samples, endpoint=False)
-        return amplitude_v * np.sin(2 * np.pi * frequency * t)
+    def _rebuild_enabled_snapshot(self):
+        """Rebuild the enabled-channel snapshot. Call with self.lock held."""
+        enabled = self._enabled.copy()
+        self._enabled_snapshot = (enabled, np.where(enabled, self._amp_uv, 0.0))
+    
+    @staticmethod
+    def _buffer_geometry(frequency: float, sample_rate: int) -> tuple:
+        """
+        Return (num_samples, cycles) for a regenerated buffer at frequency.
+        
+        For integer frequencies the buffer holds the smallest whole number of
+        cycles that also fits a whole number of samples, so it wraps without a
+        phase step and the output is exactly frequency. Otherwise it falls back
+        to one truncated period.
+        """
+        if frequency == int(frequency) and sample_rate == int(sample_rate):
+            common = gcd(int(sample_rate), int(frequency))
+            num_samples = int(sample_rate) // common
+            if num_samples >= 2:
+                return num_samples, int(frequency) // common
+        # Divide directly: sample_rate * (1 / frequency) can round just below
+        # an exact integer and lose a sample. Ensure at least 2 samples
+        return max(int(sample_rate / frequency), 2), 1
+    
+    def _unit_sinewave(self, frequency: float, sample_rate: int) -> np.ndarray:
+        """Return the cached unit-amplitude gap-free sine buffer (read-only)."""
+        key = self._buffer_geometry(frequency, sample_rate)
+        base = self._wave_cache.get(key)
+        if base is None:
+            num_samples, cycles = key
+            # Sample i sits at phase 2*pi*(i*cycles mod N)/N; reducing in
+            # integers keeps the phase exact over many cycles. The table is
+            # the only float allocation, everything else runs in place
+            index = np.arange(num_samples, dtype=np.int64)
+            if cycles != 1:
+                index *= cycles
+                index %= num_samples
+            base = index.astype(np.float64)
+            base *= _TWO_PI / num_samples
+            np.sin(base, out=base)
+            base.setflags(write=False)
+            # Cards may be set up in parallel; lookups stay lock-free
+            with self.lock:
+                self._wave_cache[key] = base
+                while len(self._wave_cache) > self.WAVE_CACHE_SLOTS:
+                    del self._wave_cache[next(iter(self._wave_cache))]
+        return base
+    
+    def generate_sinewave(self, frequency: float, amplitude_v: float, sample_rate: int,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Generate a gap-free buffer of whole sine cycles, into out if given."""
+        return np.multiply(self._unit_sinewave(frequency, sample_rate), amplitude_v, out=out)
     
     def start_generation(self) -> str:
         """Start continuous sine wave generation. Returns status message."""
@@ -197,7 +370,7 @@ class MultiCardGenerator:
             return "Generator already running"
         
         # Check if any channels are enabled
-        enabled_channels = [ch for ch in self.channels if ch.enabled]
+        enabled_channels = [self.channels[i] for i in np.flatnonzero(self._enabled)]
         print(f"Enabled channels: {len(enabled_channels)}")
         
         if not enabled_channels:
@@ -212,6 +385,7 @@ class MultiCardGenerator:
         print(f"Sample Rate: {self.sample_rate} Hz")
         
         self.stop_event.clear()
+        self._config_dirty.clear()
         self.running = True
         self.output_thread = Thread(target=self._output_worker, daemon=True)
         self.output_thread.start()
@@ -227,247 +401,358 @@ class MultiCardGenerator:
             return
         
         self.stop_event.set()
+        self._config_dirty.set()  # Wake the worker if it is parked
         self.running = False
         
         # Wait for thread to finish
         if self.output_thread:
             self.output_thread.join(timeout=2.0)
         
-        # Close all AO tasks
-        for task_name, task in list(self.ao_tasks.items()):
-            try:
-                task.stop()
-                task.close()
-            except:
-                pass
-        self.ao_tasks.clear()
-        
-        # Close all AI tasks
-        for task_name, task in list(self.ai_tasks.items()):
-            try:
-                task.stop()
-                task.close()
-            except:
-                pass
-        self.ai_tasks.clear()
+        self._close_tasks()
     
-    def _output_worker(self):
-        """Background thread that manages continuous output."""
-        print("\n*** OUTPUT WORKER THREAD STARTED ***")
-        tasks_created = False
+    @staticmethod
+    def _close_task(description: str, task: nidaqmx.Task):
+        """Stop and close a task, reporting (not raising) driver errors."""
         try:
-            # Initial task creation
+            task.stop()
+        except (nidaqmx.DaqError, RuntimeError) as e:
+            print(f"  WARNING: Stopping {description} task failed: {e}")
+        try:
+            task.close()
+        except (nidaqmx.DaqError, RuntimeError) as e:
+            print(f"  WARNING: Closing {description} task failed - it may leak driver resources: {e}")
+    
+    def _close_tasks(self):
+        """Stop and close all AO and AI tasks."""
+        # Pop each task before closing it so a failure never leaves a stale
+        # entry that would stop a replacement task from being created
+        while self.ao_tasks:
+            task_name, task = self.ao_tasks.popitem()
+            self._close_task(f"{task_name} AO", task)
+        self.ao_buffers.clear()
+        self._card_state.clear()
+        
+        while self.ai_tasks:
+            task_name, task = self.ai_tasks.popitem()
+            self._close_task(f"{task_name} AI", task)
+        self.ai_readers.clear()
+        self.ai_buffers.clear()
+    
+    def _close_card_tasks(self, card_name: str):
+        """Stop and close the AO and AI tasks of one card."""
+        for kind, tasks in (("AO", self.ao_tasks), ("AI", self.ai_tasks)):
+            task = tasks.pop(card_name, None)
+            if task is not None:
+                self._close_task(f"{card_name} {kind}", task)
+        self.ao_buffers.pop(card_name, None)
+        self._card_state.pop(card_name, None)
+        self.ai_readers.pop(card_name, None)
+        self.ai_buffers.pop(card_name, None)
+    
+    def _snapshot_config(self):
+        """
+        Return (frequency, sample_rate, {card_name: amplitudes_uv}) for cards with enabled channels.
+        
+        amplitudes_uv has one entry per AO channel of the card; disabled channels are 0.
+        """
+        # Both snapshots are replaced, never mutated, so no lock is needed
+        freq, srate = self._freq_srate  # AO sample rate
+        enabled, amps_uv = self._enabled_snapshot
+        
+        cards = {card_name: amps_uv[slc] for card_name, slc in self._card_slices.items()
+                 if enabled[slc].any()}
+        return freq, srate, cards
+    
+    def _fill_card_waveforms(self, waveforms: np.ndarray, amps_uv: np.ndarray, freq: float, srate: int):
+        """Scale the unit sine buffer into each row of waveforms and return the array to write."""
+        # One broadcast multiply fills every channel: (channels x 1) * (1 x samples)
+        amps_v = amps_uv / 1e6  # Convert microvolts to volts
+        np.multiply(amps_v[:, np.newaxis], self._unit_sinewave(freq, srate), out=waveforms)
+        # For multiple channels, nidaqmx expects a 2D array where each row is a channel
+        return waveforms[0] if len(waveforms) == 1 else waveforms
+    
+    def _configure_card_output(self, card_name: str, task: nidaqmx.Task, amps_uv: np.ndarray,
+                               freq: float, srate: int):
+        """Set the sample clock of a stopped AO task and write its regeneration buffer."""
+        samples = self._unit_sinewave(freq, srate)  # 1V reference
+        print(f"  Samples per buffer: {len(samples)}")
+        
+        task.timing.cfg_samp_clk_timing(
+            rate=srate,
+            sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
+            samps_per_chan=len(samples)
+        )
+        print(f"  Timing configured: {srate} Hz")
+        
+        # Generate waveforms for each channel with individual amplitudes
+        # by scaling the shared unit sine buffer into one (channels x samples)
+        # array, in the same order as the task's channels
+        waveforms = np.empty((len(amps_uv), len(samples)), dtype=np.float64, order='C')
+        write_data = self._fill_card_waveforms(waveforms, amps_uv, freq, srate)
+        for ch_num, (waveform, amp_uv) in enumerate(zip(waveforms, amps_uv)):
+            # Debug: show waveform stats
+            wf_min, wf_max = waveform.min(), waveform.max()
+            wf_rms = np.sqrt(np.dot(waveform, waveform) / len(waveform))
+            print(f"  Generated waveform for AO{ch_num}: {amp_uv / 1e6:.6f} V ({amp_uv:.0f} µV)")
+            print(f"    Waveform stats - Min: {wf_min:.6f}V, Max: {wf_max:.6f}V, RMS: {wf_rms:.6f}V, Samples: {len(waveform)}")
+        
+        if write_data.ndim == 1:
+            print(f"  Writing single channel waveform ({len(write_data)} samples)...")
+        else:
+            print(f"  Writing {len(waveforms)} channel waveforms (shape: {write_data.shape})...")
+        task.write(write_data, auto_start=False)
+        
+        with self.lock:
+            self.ao_buffers[card_name] = waveforms
+            self._card_state[card_name] = (freq, srate, tuple(amps_uv.tolist()))
+    
+    def _create_ao_task(self, card_name: str, amps_uv: np.ndarray, freq: float, srate: int) -> bool:
+        """Create and start the regenerating AO task for one card. Returns True on success."""
+        print(f"\nCreating task for {card_name}...")
+        try:
+            task = nidaqmx.Task()
+            print(f"  Task object created")
+            
+            # Add every channel of the card; disabled channels output zeros, so
+            # enabling or disabling one later is just a buffer write
+            for ch_num, amp_uv in enumerate(amps_uv):
+                channel_name = f"{card_name}/ao{ch_num}"
+                print(f"  Adding channel: {channel_name} ({amp_uv} µV)")
+                task.ao_channels.add_ao_voltage_chan(
+                    channel_name,
+                    min_val=-10.0,
+                    max_val=10.0
+                )
+            
+            task.out_stream.regen_mode = nidaqmx.constants.RegenerationMode.ALLOW_REGENERATION
+            self._configure_card_output(card_name, task, amps_uv, freq, srate)
+            print(f"  Starting task...")
+            task.start()
+            
             with self.lock:
-                freq = self.frequency
-                srate = self.sample_rate  # AO sample rate
-                ai_srate = self.ai_sample_rate  # AI sample rate (always max)
-                # Create copy of enabled channels
-                enabled_chs = [(ch.card_name, ch.channel_number, ch.amplitude_uv) 
-                              for ch in self.channels if ch.enabled]
+                self.ao_tasks[card_name] = task
+            print(f"  ✓ Task started successfully for {card_name}")
+            return True
             
-            print(f"Initial setup: {len(enabled_chs)} enabled channels")
+        except Exception as e:
+            print(f"  ✗ ERROR creating task for {card_name}: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def _create_ai_task(self, card_name: str, ai_srate: int):
+        """Create and start the AI task that monitors one card's outputs (optional)."""
+        try:
+            ai_task = nidaqmx.Task()
+            print(f"Creating AI task for {card_name}...")
             
-            # Group channels by card
-            cards = {}
-            for card_name, ch_num, amp_uv in enabled_chs:
-                if card_name not in cards:
-                    cards[card_name] = []
-                cards[card_name].append((ch_num, amp_uv))
+            # Add AI channels matching the AO channels
+            for ch_num in range(self.CHANNELS_PER_CARD):
+                channel_name = f"{card_name}/ai{ch_num}"
+                print(f"  Adding AI channel: {channel_name}")
+                ai_task.ai_channels.add_ai_voltage_chan(
+                    channel_name,
+                    terminal_config=nidaqmx.constants.TerminalConfiguration.PSEUDO_DIFF,
+                    min_val=-10.0,
+                    max_val=10.0
+                )
             
-            print(f"Cards to configure: {list(cards.keys())}")
+            # Configure timing for continuous acquisition with large buffer
+            # Use maximum sample rate for AI to get best oscilloscope display resolution
+            # Buffer size should be at least 2 seconds of data
+            buffer_size = int(ai_srate * 2)  # 2 seconds of buffer
+            ai_task.timing.cfg_samp_clk_timing(
+                rate=ai_srate,
+                sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
+                samps_per_chan=buffer_size
+            )
             
-            # Create tasks for each card
-            for card_name, channel_list in cards.items():
-                task_name = card_name
-                
-                print(f"\nCreating task for {card_name}...")
-                try:
-                    task = nidaqmx.Task()
-                    print(f"  Task object created")
-                    
-                    # Sort channels by channel number to ensure consistent ordering
-                    sorted_channels = sorted(channel_list, key=lambda x: x[0])
-                    
-                    # Add all channels for this card in sorted order
-                    for ch_num, amp_uv in sorted_channels:
-                        channel_name = f"{card_name}/ao{ch_num}"
-                        print(f"  Adding channel: {channel_name} ({amp_uv} µV)")
-                        task.ao_channels.add_ao_voltage_chan(
-                            channel_name,
-                            min_val=-10.0,
-                            max_val=10.0
-                        )
-                    
-                    # Configure timing
-                    period = 1.0 / freq
-                    samples = self.generate_sinewave(freq, 1.0, srate)  # 1V reference
-                    print(f"  Samples per period: {len(samples)}")
-                    
-                    task.timing.cfg_samp_clk_timing(
-                        rate=srate,
-                        sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
-                        samps_per_chan=len(samples)
-                    )
-                    print(f"  Timing configured: {srate} Hz")
-                    
-                    task.out_stream.regen_mode = nidaqmx.constants.RegenerationMode.ALLOW_REGENERATION
-                    
-                    # Generate waveforms for each channel with individual amplitudes
-                    # Use the same sorted order as when adding channels
-                    waveforms = []
-                    for ch_num, amp_uv in sorted_channels:
-                        amp_v = amp_uv / 1e6  # Convert microvolts to volts
-                        waveform = self.generate_sinewave(freq, amp_v, srate)
-                        waveforms.append(waveform)
-                        # Debug: show waveform stats
-                        wf_min, wf_max = waveform.min(), waveform.max()
-                        wf_rms = np.sqrt(np.mean(waveform**2))
-                        print(f"  Generated waveform for AO{ch_num}: {amp_v:.6f} V ({amp_uv:.0f} µV)")
-                        print(f"    Waveform stats - Min: {wf_min:.6f}V, Max: {wf_max:.6f}V, RMS: {wf_rms:.6f}V, Samples: {len(waveform)}")
-                    
-                    # Write data
-                    # For multiple channels, nidaqmx expects a 2D array where each row is a channel
-                    # Convert list of waveforms to numpy array
-                    if len(waveforms) == 1:
-                        # Single channel - write 1D array
-                        write_data = waveforms[0]
-                        print(f"  Writing single channel waveform ({len(write_data)} samples)...")
-                    else:
-                        # Multiple channels - write 2D array (channels x samples)
-                        write_data = np.array(waveforms)
-                        print(f"  Writing {len(waveforms)} channel waveforms (shape: {write_data.shape})...")
-                    
-                    task.write(write_data, auto_start=False)
-                    print(f"  Starting task...")
-                    task.start()
-                    
-                    self.ao_tasks[task_name] = task
-                    tasks_created = True
-                    print(f"  ✓ Task started successfully for {card_name}")
-                    
-                except Exception as e:
-                    print(f"  ✗ ERROR creating task for {card_name}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+            # Configure input buffer to be even larger
+            ai_task.in_stream.input_buf_size = buffer_size * 2
             
-            # Create analog input tasks to monitor outputs (optional - don't fail if this doesn't work)
-            if tasks_created:
-                print("\n--- Creating Analog Input Monitoring (Optional) ---")
-                for card_name, channel_list in cards.items():
-                    try:
-                        ai_task = nidaqmx.Task()
-                        print(f"Creating AI task for {card_name}...")
-                        
-                        # Add AI channels matching the AO channels
-                        for ch_num, _ in channel_list:
-                            channel_name = f"{card_name}/ai{ch_num}"
-                            print(f"  Adding AI channel: {channel_name}")
-                            ai_task.ai_channels.add_ai_voltage_chan(
-                                channel_name,
-                                terminal_config=nidaqmx.constants.TerminalConfiguration.PSEUDO_DIFF,
-                                min_val=-10.0,
-                                max_val=10.0
-                            )
-                        
-                        # Configure timing for continuous acquisition with large buffer
-                        # Use maximum sample rate for AI to get best oscilloscope display resolution
-                        # Buffer size should be at least 2 seconds of data
-                        buffer_size = int(ai_srate * 2)  # 2 seconds of buffer
-                        ai_task.timing.cfg_samp_clk_timing(
-                            rate=ai_srate,
-                            sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
-                            samps_per_chan=buffer_size
-                        )
-                        
-                        # Configure input buffer to be even larger
-                        ai_task.in_stream.input_buf_size = buffer_size * 2
-                        
-                        ai_task.start()
-                        self.ai_tasks[card_name] = ai_task
-                        print(f"  ✓ AI task started for {card_name}")
-                        
-                    except Exception as e:
-                        print(f"  ⚠ Could not create AI task for {card_name}: {e}")
-                        print(f"     Continuing without input monitoring for this card...")
-                        # Continue - AI monitoring is optional
-                        # Continue without AI monitoring
+            ai_task.start()
+            with self.lock:
+                self.ai_tasks[card_name] = ai_task
+                # Reads land directly in a preallocated array (see _output_worker)
+                self.ai_readers[card_name] = AnalogMultiChannelReader(ai_task.in_stream)
+            print(f"  ✓ AI task started for {card_name}")
+            
+        except Exception as e:
+            print(f"  ⚠ Could not create AI task for {card_name}: {e}")
+            print(f"     Continuing without input monitoring for this card...")
+            # Continue - AI monitoring is optional
+    
+    def _for_each_card(self, func, items) -> list:
+        """
+        Call func(*item) for each item, one card per thread.
+        
+        Cards are independent and DAQmx calls release the GIL, so configuring
+        them concurrently costs about as long as configuring one.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(*item) for item in items]
+        with ThreadPoolExecutor(max_workers=len(items)) as pool:
+            return list(pool.map(lambda item: func(*item), items))
+    
+    def _create_card_tasks(self, card_name: str, amps_uv: np.ndarray, freq: float, srate: int):
+        """Create the AO task of a card and, if that worked, its AI monitoring task."""
+        if self._create_ao_task(card_name, amps_uv, freq, srate):
+            self._create_ai_task(card_name, self.ai_sample_rate)
+    
+    def _create_tasks(self, freq: float, srate: int, cards) -> bool:
+        """Create AO tasks for every card, then the optional AI monitoring tasks."""
+        print(f"Cards to configure: {list(cards.keys())}")
+        
+        created = self._for_each_card(
+            lambda card_name, amps_uv: self._create_ao_task(card_name, amps_uv, freq, srate),
+            cards.items())
+        tasks_created = any(created)
+        
+        # Create analog input tasks to monitor outputs (optional - don't fail if this doesn't work)
+        if tasks_created:
+            print("\n--- Creating Analog Input Monitoring (Optional) ---")
+            self._for_each_card(lambda card_name: self._create_ai_task(card_name, self.ai_sample_rate),
+                                [(card_name,) for card_name in self.ao_tasks])
+        return tasks_created
+    
+    def _retime_card(self, card_name: str, amps_uv: np.ndarray, freq: float, srate: int):
+        """Move a running AO task to a new frequency/sample rate without recreating it."""
+        print(f"\nTiming of {card_name} changed - reconfiguring its task...")
+        task = self.ao_tasks[card_name]
+        try:
+            task.stop()
+            self._configure_card_output(card_name, task, amps_uv, freq, srate)
+            task.start()
+        except nidaqmx.DaqError as e:
+            print(f"  ✗ ERROR reconfiguring {card_name}: {e} - recreating its tasks")
+            self._close_card_tasks(card_name)
+            self._create_card_tasks(card_name, amps_uv, freq, srate)
+    
+    def _apply_config_changes(self):
+        """
+        Bring the running tasks in line with the current configuration, card by card.
+        
+        AO tasks stay alive until generation stops. Amplitude and enable changes
+        rewrite the buffer the card keeps regenerating (disabled channels get
+        zeros); a frequency or sample rate change stops the task, reconfigures
+        its clock and restarts it. Cards enabled for the first time get their
+        tasks created. Returns the new (freq, srate, cards).
+        """
+        freq, srate, cards = self._snapshot_config()
+        silent = np.zeros(self.CHANNELS_PER_CARD)
+        
+        retime = []
+        for card_name in list(self.ao_tasks):
+            amps_uv = cards.get(card_name, silent)
+            state = self._card_state.get(card_name)
+            if state[:2] != (freq, srate):
+                retime.append((card_name, amps_uv, freq, srate))
+            elif state[2] != tuple(amps_uv.tolist()):
+                # Amplitudes only - rewrite the buffer the card keeps regenerating
+                waveforms = self.ao_buffers[card_name]
+                try:
+                    self.ao_tasks[card_name].write(
+                        self._fill_card_waveforms(waveforms, amps_uv, freq, srate),
+                        auto_start=False)
+                    self._card_state[card_name] = (freq, srate, tuple(amps_uv.tolist()))
+                    print(f"Amplitudes updated on {card_name}")
+                except nidaqmx.DaqError as e:
+                    print(f"  ✗ ERROR updating amplitudes for {card_name}: {e}")
+        
+        create = [(card_name, amps_uv, freq, srate) for card_name, amps_uv in cards.items()
+                  if card_name not in self.ao_tasks]
+        self._for_each_card(self._retime_card, retime)
+        self._for_each_card(self._create_card_tasks, create)
+        return freq, srate, cards
+    
+    def _output_worker(self):
+        """Background thread that manages continuous output."""
+        print("\n*** OUTPUT WORKER THREAD STARTED ***")
+        try:
+            # Initial task creation
+            freq, srate, cards = self._snapshot_config()
+            print(f"Initial setup: {int(np.count_nonzero(self._enabled_snapshot[0]))} enabled channels")
             
-            if tasks_created:
+            if self._create_tasks(freq, srate, cards):
                 print("\n✓ ALL TASKS CREATED - Generation running continuously")
                 print("  (Monitoring inputs and waiting for stop signal...)")
             
             # Keep thread alive and update input measurements
-            while not self.stop_event.is_set():
+            samples_to_read, read_wait = self._ai_read_plan(freq)
+            next_check = time.monotonic() + 1.0
+            
+            # Loop invariants bound once. Tasks are only created or closed on
+            # this thread, so the task lists are rebuilt after config changes
+            stop_is_set = self.stop_event.is_set
+            config_dirty = self._config_dirty
+            scope_subscribers = self._scope_subscribers
+            scope_snapshot = self._scope_snapshot
+            rms_out, peak_out = self._rms, self._peak
+            scope_keys = {card_name: [f"{card_name}_{ch}" for ch in range(self.CHANNELS_PER_CARD)]
+                          for card_name in self.CARD_NAMES}
+            
+            def task_lists():
+                ai_items = [(card_name, self.ai_readers[card_name], self._card_slices[card_name],
+                             scope_keys[card_name]) for card_name in self.ai_tasks]
+                return ai_items, list(self.ao_tasks.items())
+            
+            ai_items, ao_items = task_lists()
+            while not stop_is_set():
                 try:
                     # Read and process input data
-                    for card_name, ai_task in list(self.ai_tasks.items()):
+                    for card_name, reader, slc, keys in ai_items:
                         try:
-                            # Read more samples to prevent buffer overflow
-                            # Read at least 0.1 seconds worth of data
-                            samples_to_read = max(int(srate * 0.1), 5000)
-                            data = ai_task.read(number_of_samples_per_channel=samples_to_read, timeout=2.0)
+                            data = self.ai_buffers.get(card_name)
+                            if data is None or data.shape[1] != samples_to_read:
+                                data = np.empty((self.CHANNELS_PER_CARD, samples_to_read))
+                                self.ai_buffers[card_name] = data
+                            # DAQmx fills the (channels x samples) array in place
+                            reader.read_many_sample(
+                                data, number_of_samples_per_channel=samples_to_read, timeout=2.0)
                             
-                            # Process each channel
-                            if isinstance(data[0], list):
-                                # Multiple channels
-                                for ch_idx, channel_data in enumerate(data):
-                                    channel_data = np.array(channel_data)
-                                    rms = np.sqrt(np.mean(channel_data**2))
-                                    peak = np.max(np.abs(channel_data))
-                                    
-                                    key = f"{card_name}_{ch_idx}"
-                                    with self.lock:
-                                        self.input_data[key] = {"rms": rms, "peak": peak}
-                                        # Store waveform for oscilloscope
-                                        if key not in self.scope_data:
-                                            self.scope_data[key] = channel_data[:self.scope_buffer_size]
-                                        else:
-                                            # Roll buffer and append new data
-                                            current = self.scope_data[key]
-                                            new_data = np.concatenate([current, channel_data])
-                                            self.scope_data[key] = new_data[-self.scope_buffer_size:]
-                            else:
-                                # Single channel
-                                channel_data = np.array(data)
-                                rms = np.sqrt(np.mean(channel_data**2))
-                                peak = np.max(np.abs(channel_data))
-                                
-                                key = f"{card_name}_0"
-                                with self.lock:
-                                    self.input_data[key] = {"rms": rms, "peak": peak}
-                                    # Store waveform for oscilloscope
-                                    if key not in self.scope_data:
-                                        self.scope_data[key] = channel_data[:self.scope_buffer_size]
-                                    else:
-                                        # Roll buffer and append new data
-                                        current = self.scope_data[key]
-                                        new_data = np.concatenate([current, channel_data])
-                                        self.scope_data[key] = new_data[-self.scope_buffer_size:]
+                            # Only channels someone looks at need any work: enabled
+                            # channels feed the meters, open scopes feed the buffers
+                            scoped = scope_subscribers[slc] > 0
+                            watched = scoped | self._enabled_snapshot[0][slc]
+                            if not watched.any():
+                                continue
+                            rms, peak = _rms_peak(data)
+                            
+                            # Update the card's measurements in one masked write
+                            np.copyto(rms_out[slc], rms, where=watched)
+                            np.copyto(peak_out[slc], peak, where=watched)
+                            
+                            # Store waveforms for oscilloscope (no lock needed)
+                            for ch_idx in np.flatnonzero(scoped).tolist():
+                                key = keys[ch_idx]
+                                scope_snapshot[key] = self._scope_append(key, data[ch_idx])
                         except Exception as e:
                             # Log AI read errors but continue
                             if "timeout" not in str(e).lower():
                                 print(f"  AI read error for {card_name}: {e}")
                     
-                    # Verify AO tasks are still running (every 20 iterations = ~1 second)
-                    if not hasattr(self, '_check_counter'):
-                        self._check_counter = 0
-                    self._check_counter += 1
-                    
-                    if self._check_counter >= 20:
-                        self._check_counter = 0
-                        for card_name, ao_task in list(self.ao_tasks.items()):
+                    # Verify AO tasks are still running (about once per second)
+                    if time.monotonic() >= next_check:
+                        next_check = time.monotonic() + 1.0
+                        for card_name, ao_task in ao_items:
                             try:
                                 # Check if task is still running
                                 if not ao_task.is_task_done():
                                     pass  # Task is running fine
                                 else:
                                     print(f"  WARNING: AO task for {card_name} has stopped!")
-                            except:
-                                pass
+                            except nidaqmx.DaqError as e:
+                                print(f"  WARNING: AO task for {card_name} reported an error: {e}")
                     
-                    # Sleep less to read more frequently and prevent buffer overflow
-                    time.sleep(0.02)  # Read every 20ms instead of 50ms
+                    # Park until a setter changes the configuration. While inputs are
+                    # monitored, wake for the next read to keep draining the AI buffers
+                    if config_dirty.wait(timeout=read_wait if ai_items else 1.0):
+                        config_dirty.clear()
+                        if not stop_is_set():
+                            freq, srate, cards = self._apply_config_changes()
+                            samples_to_read, read_wait = self._ai_read_plan(freq)
+                            ai_items, ao_items = task_lists()
                     
                 except Exception as e:
                     print(f"  Error in monitoring loop: {e}")
@@ -484,42 +769,93 @@ class MultiCardGenerator:
         finally:
             # Clean up
             print("Cleaning up tasks...")
-            for task in list(self.ao_tasks.values()):
-                try:
-                    task.stop()
-                    task.close()
-                except:
-                    pass
-            self.ao_tasks.clear()
-            
-            for task in list(self.ai_tasks.values()):
-                try:
-                    task.stop()
-                    task.close()
-                except:
-                    pass
-            self.ai_tasks.clear()
+            self._close_tasks()
             print("*** OUTPUT WORKER THREAD ENDED ***")
-
-
+    
+    def _ai_read_plan(self, frequency: float) -> tuple:
+        """
+        Return (samples_to_read, wait_seconds) for the AI monitoring loop.
+        
+        Each read covers about 8 cycles of the output frequency so RMS/peak
+        stay stable, bounded to 4096 samples and a quarter second of input.
+        The loop waits half a read period between reads.
+        """
+        samples = int(self.ai_sample_rate * 8 / frequency) if frequency > 0 else 0
+        samples = min(max(samples, 4096), self.ai_sample_rate // 4)
+        return samples, samples / self.ai_sample_rate * 0.5
+    
+    def _scope_append(self, key: str, samples: np.ndarray) -> np.ndarray:
+        """Append samples to a channel's circular scope buffer and return a new
+        read-only oldest-to-newest copy for publishing. Worker thread only."""
+        buf = self._scope_ring.get(key)
+        if buf is None:
+            # float32 halves the memory traffic of the copies and of plotting;
+            # RMS/peak are computed from the float64 reads before this
+            buf = self._scope_ring[key] = np.empty(self.scope_buffer_size, dtype=np.float32)
+            self._scope_write_idx[key] = 0
+            self._scope_fill[key] = 0
+        size = len(buf)
+        # Only the newest size samples can survive the write
+        if len(samples) > size:
+            samples = samples[-size:]
+        n = len(samples)
+        i = self._scope_write_idx[key]
+        first = min(n, size - i)
+        buf[i:i + first] = samples[:first]
+        buf[:n - first] = samples[first:]
+        idx = self._scope_write_idx[key] = (i + n) % size
+        fill = self._scope_fill[key] = min(self._scope_fill[key] + n, size)
+        
+        # Unroll into a fresh array; the ring keeps being overwritten
+        if fill < size:
+            wave = buf[:idx].copy()
+        else:
+            wave = np.concatenate((buf[idx:], buf[:idx]))
+        wave.flags.writeable = False
+        return wave
+    
+    def subscribe_scope(self, card_name: str, channel_number: int):
+        """Register an open oscilloscope window for an input channel."""
+        with self.lock:
+            self._scope_subscribers[self.CARD_NAMES.index(card_name) * self.CHANNELS_PER_CARD
+                                    + channel_number] += 1
+    
+    def unsubscribe_scope(self, card_name: str, channel_number: int):
+        """Unregister an oscilloscope window opened with subscribe_scope."""
+        with self.lock:
+            index = self.CARD_NAMES.index(card_name) * self.CHANNELS_PER_CARD + channel_number
+            self._scope_subscribers[index] = max(self._scope_subscribers[index] - 1, 0)
+    
     def get_input_measurements(self, card_name: str, channel_number: int) -> Dict[str, float]:
         """Get RMS and peak measurements for a specific input channel."""
-        key = f"{card_name}_{channel_number}"
-        with self.lock:
-            return self.input_data.get(key, {"rms": 0.0, "peak": 0.0}).copy()
+        index = self._input_index.get(f"{card_name}_{channel_number}")
+        if index is None:
+            return {"rms": 0.0, "peak": 0.0}
+        return {"rms": float(self._rms[index]), "peak": float(self._peak[index])}
+    
+    def get_all_input_measurements(self, card_name: Optional[str] = None) -> tuple:
+        """
+        Get (rms, peak) arrays for several input channels in one call.
+        
+        With card_name, the arrays cover that card and are indexed by channel
+        number; otherwise they cover all channels in self.channels order.
+        """
+        slc = self._card_slices[card_name] if card_name is not None else slice(None)
+        return self._rms[slc].copy(), self._peak[slc].copy()
     
     def get_scope_data(self, card_name: str, channel_number: int) -> np.ndarray:
-        """Get oscilloscope waveform data for a specific input channel. Returns a copy."""
-        key = f"{card_name}_{channel_number}"
-        with self.lock:
-            data = self.scope_data.get(key, np.array([]))
-            # Return a copy so we don't hold the lock during plotting
-            return data.copy() if len(data) > 0 else np.array([])
+        """Get oscilloscope waveform data for a specific input channel.
+        
+        Returns the latest published snapshot (read-only, oldest sample first).
+        """
+        return self._scope_snapshot.get(f"{card_name}_{channel_number}", _EMPTY_SCOPE)
 
 
 class OscilloscopeWindow:
     """Oscilloscope display window for viewing real-time waveforms."""
     
+    STATS_TEMPLATE = 'RMS: {:.1f} µV\nPeak: {:.1f} µV\nFreq: {:.1f} Hz\nSamples/Cycle: {:.1f}'
+    
     def __init__(self, parent, generator: MultiCardGenerator, card_name: str, channel_number: int):
         self.generator = generator
         self.card_name = card_name
@@ -554,8 +890,14 @@ class OscilloscopeWindow:
                                        fontsize=9,
                                        bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
         
-        # Canvas
+        # Canvas. The trace and text overlays are animated artists: they are
+        # blitted over a cached background, so the axes, grid and labels are
+        # only re-rendered on a full draw (limit change or window resize)
         self.canvas = FigureCanvasTkAgg(self.fig, self.window)
+        self._bg = None
+        for artist in (self.line, self.clip_text, self.stats_text):
+            artist.set_animated(True)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         
@@ -578,7 +920,17 @@ class OscilloscopeWindow:
         ttk.Button(controls, text="Freeze", command=self.toggle_freeze).pack(side=tk.LEFT, padx=5)
         self.frozen = False
         
-        # Start update loop
+        # Ask the generator to keep this channel's scope buffer filled
+        self.generator.subscribe_scope(card_name, channel_number)
+        
+        # Plot buffers, reused until the time span or canvas width changes
+        self._plot_key = None
+        self._plot_t = None
+        self._plot_y = None
+        self._plot_starts = None
+        
+        # Start update loop (ticks are timed against the monotonic clock)
+        self._next_t = time.monotonic()
         self.update_plot()
     
     def toggle_freeze(self):
@@ -588,8 +940,20 @@ class OscilloscopeWindow:
     def on_close(self):
         """Handle window close."""
         self.is_running = False
+        self.generator.unsubscribe_scope(self.card_name, self.channel_number)
         self.window.destroy()
     
+    def _on_draw(self, event):
+        """Re-capture the background after every full draw."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        """Draw the trace and text overlays onto the canvas."""
+        self.ax.draw_artist(self.line)
+        self.ax.draw_artist(self.clip_text)
+        self.ax.draw_artist(self.stats_text)
+    
     def update_plot(self):
         """Update the oscilloscope display."""
         if not self.is_running:
@@ -618,18 +982,46 @@ class OscilloscopeWindow:
                         # Get last N samples
                         display_data = data[-samples_to_show:]
                         
-                        # Create time axis in milliseconds using AI sample rate
-                        time_ms = np.arange(len(display_data)) / self.generator.ai_sample_rate * 1000
+                        # One pass each for min, max and sum of squares; every
+                        # statistic below derives from these, no |x| temporary
+                        dmax = float(display_data.max())
+                        dmin = float(display_data.min())
+                        peak = dmax if dmax > -dmin else -dmin
+                        rms = np.sqrt(float(np.dot(display_data, display_data)) / samples_to_show)
+                        
+                        # Update plot; with more than two samples per pixel, draw
+                        # only the min/max envelope of each pixel column
+                        px = self.canvas.get_tk_widget().winfo_width()
+                        if px <= 1:  # Not mapped yet
+                            px = 500
+                        decimate = samples_to_show > 2 * px
                         
-                        # Update plot
-                        self.line.set_data(time_ms, display_data)
+                        # Time axis (ms, AI sample rate) and the decimated trace
+                        # buffer only change with the span or the canvas width
+                        plot_key = (samples_to_show, px if decimate else 0)
+                        if plot_key != self._plot_key:
+                            self._plot_key = plot_key
+                            time_ms = np.arange(samples_to_show) * (1000.0 / self.generator.ai_sample_rate)
+                            if decimate:
+                                self._plot_starts = _minmax_starts(samples_to_show, px)
+                                self._plot_t = _minmax_time(time_ms, self._plot_starts)
+                                self._plot_y = np.empty(2 * px, dtype=display_data.dtype)
+                            else:
+                                self._plot_t = time_ms
+                        
+                        if decimate:
+                            self.line.set_data(self._plot_t,
+                                               _minmax_decimate(display_data, self._plot_starts, out=self._plot_y))
+                        else:
+                            self.line.set_data(self._plot_t, display_data)
+                        old_limits = (self.ax.get_xlim(), self.ax.get_ylim())
                         self.ax.set_xlim(0, timespan_ms)
                         
                         # Update Y scale
                         yscale = self.yscale_var.get()
                         if yscale == "Auto":
-                            margin = max(np.max(np.abs(display_data)) * 0.1, 0.0001)
-                            self.ax.set_ylim(np.min(display_data) - margin, np.max(display_data) + margin)
+                            margin = max(peak * 0.1, 0.0001)
+                            self.ax.set_ylim(dmin - margin, dmax + margin)
                         else:
                             # Parse scale value (handle µV, mV, V)
                             yscale_str = yscale.replace('±', '')
@@ -642,34 +1034,43 @@ class OscilloscopeWindow:
                             self.ax.set_ylim(-limit, limit)
                         
                         # Check for clipping (near ±10V)
-                        max_val = np.max(np.abs(display_data))
-                        if max_val > 9.5:
+                        if peak > 9.5:
                             self.clip_text.set_text('⚠ CLIPPING DETECTED!')
-                        elif max_val > 9.0:
+                        elif peak > 9.0:
                             self.clip_text.set_text('⚠ Near Clipping')
                         else:
                             self.clip_text.set_text('')
                         
                         # Update stats with samples per cycle info
-                        rms = np.sqrt(np.mean(display_data**2))
-                        peak = np.max(np.abs(display_data))
                         freq_est = self.generator.frequency
                         samples_per_cycle = self.generator.ai_sample_rate / freq_est
                         # Display in µV for better readability with high-gain amplifiers
                         rms_uv = rms * 1e6
                         peak_uv = peak * 1e6
-                        stats = f'RMS: {rms_uv:.1f} µV\nPeak: {peak_uv:.1f} µV\nFreq: {freq_est:.1f} Hz\nSamples/Cycle: {samples_per_cycle:.1f}'
-                        self.stats_text.set_text(stats)
+                        stats = self.STATS_TEMPLATE.format(rms_uv, peak_uv, freq_est, samples_per_cycle)
+                        if stats != self.stats_text.get_text():
+                            self.stats_text.set_text(stats)
                         
-                        # Use draw_idle() instead of draw() - non-blocking
-                        self.canvas.draw_idle()
+                        # New limits change the background: schedule a full
+                        # (non-blocking) draw. Otherwise blit just the trace
+                        if self._bg is None or (self.ax.get_xlim(), self.ax.get_ylim()) != old_limits:
+                            self.canvas.draw_idle()
+                        else:
+                            self.canvas.restore_region(self._bg)
+                            self._draw_animated()
+                            self.canvas.blit(self.ax.bbox)
         except Exception as e:
             # Don't let plotting errors stop the oscilloscope
             print(f"Oscilloscope update error: {e}")
         
-        # Schedule next update
+        # Schedule next update at a steady 10 Hz (less aggressive). If this one
+        # overran, skip the missed ticks rather than queueing them up
         if self.is_running:
-            self.window.after(100, self.update_plot)  # Update at 10 Hz (less aggressive)
+            now = time.monotonic()
+            self._next_t += 0.1
+            if self._next_t <= now:
+                self._next_t = now + 0.1
+            self.window.after(max(1, int((self._next_t - now) * 1000)), self.update_plot)
 
 
 class PXIeControlGUI:
@@ -689,6 +1090,10 @@ class PXIeControlGUI:
         self.current_sample_rate = 100000
         self.is_generating = False
         
+        # Widget updates queued by bulk operations, applied in one idle pass
+        self._pending_ui: List[tuple] = []
+        self._flush_pending = False
+        
         # Build UI
         self.setup_ui()
         
@@ -696,6 +1101,7 @@ class PXIeControlGUI:
         self.update_frequency_selection()
         
         # Start periodic update of input measurements
+        self._next_display_t = time.monotonic()
         self.update_input_displays()
     
     def setup_ui(self):
@@ -711,8 +1117,9 @@ class PXIeControlGUI:
         self.freq_combo = ttk.Combobox(control_frame, textvariable=self.freq_var, 
                                        width=20, state='readonly')
         
-        available_freqs = self.freq_manager.get_available_frequencies()
-        freq_options = [f"{f.frequency} Hz - {f.name}" for f in available_freqs]
+        # Keep the options themselves; selections are resolved by combobox index
+        self._freq_objs = self.freq_manager.get_available_frequencies()
+        freq_options = [f"{f.frequency} Hz - {f.name}" for f in self._freq_objs]
         self.freq_combo['values'] = freq_options
         if freq_options:
             self.freq_combo.current(0)
@@ -748,16 +1155,17 @@ class PXIeControlGUI:
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Create notebook for cards
-        notebook = ttk.Notebook(self.root)
-        notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        # Create tab for each card
+        # Create tab for each card (tab i is CARD_NAMES[i])
         self.card_frames = {}
-        self.channel_widgets = {}  # Store widgets for each channel
+        self.channel_widgets = {}  # Store widgets for each channel, keyed by (card_name, channel_number)
+        self.card_widgets: Dict[str, List[dict]] = {}  # Same widget dicts per card, in channel order
         
         for card_name in MultiCardGenerator.CARD_NAMES:
-            tab = ttk.Frame(notebook)
-            notebook.add(tab, text=f"Card {card_name}")
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=f"Card {card_name}")
             
             self.card_frames[card_name] = tab
             self.create_card_panel(tab, card_name)
@@ -823,7 +1231,7 @@ class PXIeControlGUI:
         frame = ttk.Frame(parent, relief=tk.RIDGE, borderwidth=1)
         frame.pack(fill=tk.X, padx=5, pady=2)
         
-        key = f"{channel.card_name}_ch{channel.channel_number}"
+        key = (channel.card_name, channel.channel_number)
         
         # Channel label
         ttk.Label(frame, text=f"AO{channel.channel_number}", 
@@ -843,12 +1251,14 @@ class PXIeControlGUI:
         amp_entry.bind('<FocusOut>', lambda e: self.on_amplitude_changed(channel, amp_var))
         
         # Input RMS display
-        rms_label = ttk.Label(frame, text="0.000 V", width=10, anchor=tk.E, 
+        rms_var = tk.StringVar(value="0.000 V")
+        rms_label = ttk.Label(frame, textvariable=rms_var, width=10, anchor=tk.E, 
                              font=('Courier', 9), foreground='blue')
         rms_label.pack(side=tk.LEFT, padx=5)
         
         # Input peak display
-        peak_label = ttk.Label(frame, text="0.000 V", width=10, anchor=tk.E,
+        peak_var = tk.StringVar(value="0.000 V")
+        peak_label = ttk.Label(frame, textvariable=peak_var, width=10, anchor=tk.E,
                               font=('Courier', 9), foreground='darkgreen')
         peak_label.pack(side=tk.LEFT, padx=5)
         
@@ -865,10 +1275,13 @@ class PXIeControlGUI:
         self.channel_widgets[key] = {
             'enabled_var': enabled_var,
             'amp_var': amp_var,
-            'rms_label': rms_label,
-            'peak_label': peak_label,
-            'status_label': status_label
+            'rms_var': rms_var,
+            'peak_var': peak_var,
+            'status_label': status_label,
+            'last_rms_text': "0.000 V",  # Text currently shown, to skip no-op updates
+            'last_peak_text': "0.000 V"
         }
+        self.card_widgets.setdefault(channel.card_name, []).append(self.channel_widgets[key])
     
     def open_oscilloscope(self, channel: ChannelConfig):
         """Open oscilloscope window for a specific channel."""
@@ -888,6 +1301,20 @@ class PXIeControlGUI:
             messagebox.showerror("Oscilloscope Error", 
                                f"Failed to open oscilloscope:\n{e}")
     
+    def _queue_ui(self, func, *args, **kwargs):
+        """Queue a widget update; queued updates are applied together when Tk is idle."""
+        self._pending_ui.append((func, args, kwargs))
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.root.after_idle(self._flush_ui)
+    
+    def _flush_ui(self):
+        """Apply all queued widget updates."""
+        pending, self._pending_ui = self._pending_ui, []
+        self._flush_pending = False
+        for func, args, kwargs in pending:
+            func(*args, **kwargs)
+    
     def on_frequency_changed(self, event=None):
         """Handle frequency selection change."""
         self.update_frequency_selection()
@@ -895,13 +1322,10 @@ class PXIeControlGUI:
     def update_frequency_selection(self):
         """Update frequency and sample rate based on selection."""
         try:
-            selected = self.freq_var.get()
-            if not selected:
+            index = self.freq_combo.current()
+            if index < 0:
                 return
-            
-            # Parse frequency from selection
-            freq_str = selected.split(' ')[0]
-            frequency = float(freq_str)
+            frequency = self._freq_objs[index].frequency
             
             # Calculate optimal sample rate
             sample_rate = self.freq_manager.calculate_sample_rate(frequency)
@@ -939,7 +1363,7 @@ class PXIeControlGUI:
         self.generator.set_channel_enabled(channel.card_name, channel.channel_number, enabled)
         
         # Update status
-        key = f"{channel.card_name}_ch{channel.channel_number}"
+        key = (channel.card_name, channel.channel_number)
         if key in self.channel_widgets:
             status_label = self.channel_widgets[key]['status_label']
             if enabled:
@@ -960,7 +1384,7 @@ class PXIeControlGUI:
                                                 amplitude_uv)
             
             # Update status
-            key = f"{channel.card_name}_ch{channel.channel_number}"
+            key = (channel.card_name, channel.channel_number)
             if key in self.channel_widgets:
                 status_label = self.channel_widgets[key]['status_label']
                 amp_mv = amplitude_uv / 1000
@@ -982,15 +1406,16 @@ class PXIeControlGUI:
                 self.generator.set_channel_enabled(card_name, ch_num, enabled)
                 
                 # Update UI
-                key = f"{card_name}_ch{ch_num}"
+                key = (card_name, ch_num)
                 if key in self.channel_widgets:
-                    self.channel_widgets[key]['enabled_var'].set(enabled)
+                    self._queue_ui(self.channel_widgets[key]['enabled_var'].set, enabled)
                     status_label = self.channel_widgets[key]['status_label']
                     if enabled:
-                        status_label.config(text="Enabled" if self.is_generating else "Ready", 
-                                          foreground='green')
+                        self._queue_ui(status_label.config, 
+                                       text="Enabled" if self.is_generating else "Ready", 
+                                       foreground='green')
                     else:
-                        status_label.config(text="Disabled", foreground='gray')
+                        self._queue_ui(status_label.config, text="Disabled", foreground='gray')
     
     def set_all_amplitudes(self, card_name: str, amp_entry: ttk.Entry):
         """Set amplitude for all channels on a card."""
@@ -1005,9 +1430,9 @@ class PXIeControlGUI:
                     self.generator.set_channel_amplitude(card_name, ch_num, amplitude_uv)
                     
                     # Update UI
-                    key = f"{card_name}_ch{ch_num}"
+                    key = (card_name, ch_num)
                     if key in self.channel_widgets:
-                        self.channel_widgets[key]['amp_var'].set(str(amplitude_uv))
+                        self._queue_ui(self.channel_widgets[key]['amp_var'].set, str(amplitude_uv))
             
             self.status_var.set(f"Set all channels on {card_name} to {amplitude_uv} µV")
         
@@ -1058,8 +1483,9 @@ class PXIeControlGUI:
                 else:
                     widgets['status_label'].config(text="Disabled", foreground='gray')
                 # Clear input displays
-                widgets['rms_label'].config(text="0.000 V")
-                widgets['peak_label'].config(text="0.000 V")
+                widgets['rms_var'].set("0.000 V")
+                widgets['peak_var'].set("0.000 V")
+                widgets['last_rms_text'] = widgets['last_peak_text'] = "0.000 V"
         
         except Exception as e:
             messagebox.showerror("Stop Error", f"Failed to stop generation:\n{e}")
@@ -1067,26 +1493,32 @@ class PXIeControlGUI:
     def update_input_displays(self):
         """Periodically update input measurement displays."""
         if self.is_generating:
-            # Update each enabled channel's input measurements
-            for key, widgets in self.channel_widgets.items():
+            # Update each enabled channel's input measurements, on the visible
+            # card only; other tabs catch up when they are selected
+            visible_card = MultiCardGenerator.CARD_NAMES[self.notebook.index('current')]
+            
+            # Fetch the card's measurements at once
+            rms_all, peak_all = self.generator.get_all_input_measurements(visible_card)
+            
+            for index, widgets in enumerate(self.card_widgets.get(visible_card, ())):
                 if widgets['enabled_var'].get():
-                    # Parse card name and channel from key (e.g., "SV1_ch0")
-                    parts = key.split('_ch')
-                    if len(parts) == 2:
-                        card_name = parts[0]
-                        ch_num = int(parts[1])
-                        
-                        # Get measurements from generator
-                        measurements = self.generator.get_input_measurements(card_name, ch_num)
-                        rms = measurements.get('rms', 0.0)
-                        peak = measurements.get('peak', 0.0)
-                        
-                        # Update display labels
-                        widgets['rms_label'].config(text=f"{rms:.6f} V")
-                        widgets['peak_label'].config(text=f"{peak:.6f} V")
-        
-        # Schedule next update (100ms)
-        self.root.after(100, self.update_input_displays)
+                    # Update display variables, skipping the Tk call when the
+                    # text would not change
+                    rms_text = f"{rms_all[index]:.6f} V"
+                    if rms_text != widgets['last_rms_text']:
+                        widgets['rms_var'].set(rms_text)
+                        widgets['last_rms_text'] = rms_text
+                    peak_text = f"{peak_all[index]:.6f} V"
+                    if peak_text != widgets['last_peak_text']:
+                        widgets['peak_var'].set(peak_text)
+                        widgets['last_peak_text'] = peak_text
+        
+        # Schedule next update (every 100ms, skipping ticks after an overrun)
+        now = time.monotonic()
+        self._next_display_t += 0.1
+        if self._next_display_t <= now:
+            self._next_display_t = now + 0.1
+        self.root.after(max(1, int((self._next_display_t - now) * 1000)), self.update_input_displays)
 
 
 def connect_to_chassis():
@@ -5,14 +5,22 @@ Supports 4 cards (SV1-SV4) with per-channel amplitude control in microvolts.
 
 import nidaqmx
 import nidaqmx.system
+from nidaqmx.stream_readers import AnalogSingleChannelReader
+from nidaqmx.stream_writers import AnalogMultiChannelWriter, AnalogSingleChannelWriter
 import numpy as np
+import os
 import time
 import csv
+from bisect import bisect_left, bisect_right
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from threading import Thread, Event, Lock
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Dict, Optional
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
 @dataclass
@@ -24,18 +32,50 @@ class FrequencyOption:
     enabled: bool = False
 
 
-@dataclass
 class ChannelConfig:
-    """Configuration for a single output channel."""
-    card_name: str
-    channel_number: int  # 0-7 for PXIe-4468
-    amplitude_uv: float = 1000.0  # microvolts
-    enabled: bool = True
+    """
+    Configuration for a single output channel.
+    
+    A view onto one slot of MultiCardGenerator's per-channel arrays, so the
+    GUI keeps an object per channel while the generator works on the arrays.
+    """
+    __slots__ = ('card_name', 'channel_number', '_generator', '_index')
+    
+    def __init__(self, generator: 'MultiCardGenerator', index: int):
+        self._generator = generator
+        self._index = index
+        self.card_name = generator.CARD_NAMES[generator._card_idx[index]]
+        self.channel_number = int(generator._ch_num[index])  # 0-7 for PXIe-4468
+    
+    @property
+    def amplitude_uv(self) -> float:
+        """Amplitude in microvolts."""
+        return float(self._generator._amp_uv[self._index])
+    
+    @amplitude_uv.setter
+    def amplitude_uv(self, value: float):
+        self._generator._amp_uv[self._index] = value
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self._generator._enabled[self._index])
+    
+    @enabled.setter
+    def enabled(self, value: bool):
+        self._generator._enabled[self._index] = value
+    
+    def __repr__(self):
+        return (f"ChannelConfig(card_name={self.card_name!r}, channel_number={self.channel_number}, "
+                f"amplitude_uv={self.amplitude_uv}, enabled={self.enabled})")
 
 
 class FrequencyManager:
     """Manages loading and selection of frequencies from CSV."""
     
+    # Common sample rates, ascending
+    COMMON_SAMPLE_RATES = (1000, 2500, 5000, 10000, 25000, 50000, 100000,
+                           200000, 500000, 1000000, 2000000)
+    
     def __init__(self, csv_path: str = "frequencies.csv"):
         self.csv_path = csv_path
         self.frequencies: List[FrequencyOption] = []
@@ -44,14 +84,21 @@ class FrequencyManager:
     def load_frequencies(self):
         """Load frequencies from CSV file."""
         try:
-            with open(self.csv_path, 'r') as f:
-                reader = csv.DictReader(f)
+            with open(self.csv_path, 'r', newline='') as f:
+                reader = csv.reader(f)
+                # Resolve column positions once; rows are then plain lists
+                header = [name.strip() for name in next(reader)]
+                freq_col = header.index('Frequency')
+                name_col = header.index('Name') if 'Name' in header else None
+                avail_col = header.index('Available') if 'Available' in header else None
+                enabled_col = header.index('Enabled') if 'Enabled' in header else None
+                
                 for row in reader:
                     try:
-                        freq = float(row['Frequency'])
-                        name = row.get('Name', f"{freq} Hz")
-                        available = row.get('Available', '').strip().upper() == 'X'
-                        enabled = row.get('Enabled', '').strip().upper() == 'X'
+                        freq = float(row[freq_col])
+                        name = row[name_col] if name_col is not None else f"{freq} Hz"
+                        available = avail_col is not None and row[avail_col].strip().upper() == 'X'
+                        enabled = enabled_col is not None and row[enabled_col].strip().upper() == 'X'
                         
                         self.frequencies.append(FrequencyOption(
                             frequency=freq,
@@ -59,7 +106,7 @@ class FrequencyManager:
                             available=available,
                             enabled=enabled
                         ))
-                    except (ValueError, KeyError):
+                    except (ValueError, IndexError):
                         continue
         except Exception as e:
             print(f"Error loading frequencies from {self.csv_path}: {e}")
@@ -85,59 +132,72 @@ class FrequencyManager:
         min_samples_per_cycle = 100
         base_rate = frequency * min_samples_per_cycle
         
-        # Round to common sample rates
-        common_rates = [1000, 2500, 5000, 10000, 25000, 50000, 100000, 
-                       200000, 500000, 1000000, 2000000]
-        
-        for rate in common_rates:
-            if rate >= base_rate:
-                return rate
+        # Round up to the nearest common sample rate
+        rates = self.COMMON_SAMPLE_RATES
+        index = bisect_left(rates, base_rate)
+        if index < len(rates):
+            return rates[index]
         
         # If frequency is very high, use maximum
         return 2000000  # 2 MS/s max for PXIe-4468
 
 
+# Immutable generator settings; replaced wholesale, so readers need no lock
+_Params = namedtuple('_Params', 'frequency sample_rate amp_uv enabled')
+
+
 class MultiCardGenerator:
     """Manages sine wave generation across multiple PXIe-4468 cards."""
     
     CHANNELS_PER_CARD = 8
     CARD_NAMES = ["SV1", "SV2", "SV3", "SV4"]
+    UNIT_WAVE_SLOTS = 16  # Cached unit sine tables (oldest dropped first)
     
     def __init__(self):
         self.tasks: Dict[str, nidaqmx.Task] = {}
+        self._card_buffers: Dict[str, np.ndarray] = {}  # (channels x samples) AO data per task
+        self._writers: Dict[str, object] = {}  # Stream writer per task
+        self._card_state: Dict[str, tuple] = {}  # Per task: (channel numbers, freq, srate, amplitudes_v)
         self.lock = Lock()
         self.running = False
         self.stop_event = Event()
+        self._dirty = Event()  # Set when settings change (or on stop) to wake the worker
         
         # Current configuration
         self.frequency = 1000.0  # Hz
         self.sample_rate = 100000  # Hz
         self.channels: List[ChannelConfig] = []
         
-        # Initialize all channels for all cards (disabled by default)
-        for card_name in self.CARD_NAMES:
-            for ch in range(self.CHANNELS_PER_CARD):
-                self.channels.append(ChannelConfig(
-                    card_name=card_name,
-                    channel_number=ch,
-                    amplitude_uv=1000.0,
-                    enabled=False
-                ))
+        # Unit-amplitude one-period sine tables, keyed by (frequency, sample_rate).
+        # All channels share the table and only scale it by their amplitude
+        self._unit_wave_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        
+        # Channel state as parallel arrays; channel i is channel number
+        # i % CHANNELS_PER_CARD on card i // CHANNELS_PER_CARD
+        num_channels = len(self.CARD_NAMES) * self.CHANNELS_PER_CARD
+        self._amp_uv = np.full(num_channels, 1000.0)  # microvolts
+        self._enabled = np.zeros(num_channels, dtype=bool)  # Disabled by default
+        self._card_idx = np.repeat(np.arange(len(self.CARD_NAMES), dtype=np.int8), self.CHANNELS_PER_CARD)
+        self._ch_num = np.tile(np.arange(self.CHANNELS_PER_CARD, dtype=np.int8), len(self.CARD_NAMES))
+        
+        # Initialize all channels for all cards
+        self.channels = [ChannelConfig(self, index) for index in range(num_channels)]
+        self._channel_index: Dict[tuple, ChannelConfig] = {
+            (ch.card_name, ch.channel_number): ch for ch in self.channels}
+        self._publish_params()
         
         self.output_thread = None
     
     def get_channel(self, card_name: str, channel_number: int) -> Optional[ChannelConfig]:
         """Get configuration for a specific channel."""
-        for ch in self.channels:
-            if ch.card_name == card_name and ch.channel_number == channel_number:
-                return ch
-        return None
+        return self._channel_index.get((card_name, channel_number))
     
     def set_frequency(self, frequency: float, sample_rate: int):
         """Set the output frequency and sample rate for all channels."""
         with self.lock:
             self.frequency = frequency
             self.sample_rate = sample_rate
+            self._publish_params()
     
     def set_channel_amplitude(self, card_name: str, channel_number: int, amplitude_uv: float):
         """Set amplitude for a specific channel in microvolts."""
@@ -145,6 +205,7 @@ class MultiCardGenerator:
         if channel:
             with self.lock:
                 channel.amplitude_uv = amplitude_uv
+                self._publish_params()
     
     def set_channel_enabled(self, card_name: str, channel_number: int, enabled: bool):
         """Enable or disable a specific channel."""
@@ -152,16 +213,48 @@ class MultiCardGenerator:
         if channel:
             with self.lock:
                 channel.enabled = enabled
+                self._publish_params()
+    
+    def _publish_params(self):
+        """Snapshot the settings into self._params. Call with self.lock held (or from __init__)."""
+        amp_uv = self._amp_uv.copy()
+        enabled = self._enabled.copy()
+        amp_uv.setflags(write=False)
+        enabled.setflags(write=False)
+        # A single attribute store, atomic for readers
+        self._params = _Params(self.frequency, self.sample_rate, amp_uv, enabled)
+        self._dirty.set()
+    
+    def _unit_sinewave(self, frequency: float, sample_rate: int) -> np.ndarray:
+        """Return the cached unit-amplitude single period (read-only)."""
+        key = (frequency, sample_rate)
+        unit = self._unit_wave_cache.get(key)
+        if unit is None:
+            # Divide directly (sample_rate * (1 / frequency) can round just below
+            # an exact integer and lose a sample). Ensure at least 2 samples
+            num_samples = max(int(sample_rate / frequency), 2) if frequency > 0 else 2
+            # The period spans exactly num_samples samples, so the phase of
+            # sample k is 2*pi*k/num_samples; build it and take sin in place
+            unit = np.arange(num_samples, dtype=np.float64)
+            unit *= 2 * np.pi / num_samples
+            if num_samples % 4 == 0:
+                quarter = num_samples // 4
+                # Quarter-wave symmetry: evaluate sin on [0, pi/2] only, then
+                # mirror into [pi/2, pi] and negate the first half into the second
+                np.sin(unit[:quarter + 1], out=unit[:quarter + 1])
+                unit[quarter:2 * quarter + 1] = unit[quarter::-1]
+                np.negative(unit[:2 * quarter], out=unit[2 * quarter:])
+            else:
+                np.sin(unit, out=unit)
+            unit.setflags(write=False)
+            self._unit_wave_cache[key] = unit
+            if len(self._unit_wave_cache) > self.UNIT_WAVE_SLOTS:
+                self._unit_wave_cache.popitem(last=False)
+        return unit
     
     def generate_sinewave(self, frequency: float, amplitude_v: float, sample_rate: int) -> np.ndarray:
         """Generate one period of a sine wave."""
-        period = 1.0 / frequency
-        num_samples = int(sample_rate * period)
-        # Ensure at least 2 samples
-        if num_samples < 2:
-            num_samples = 2
-        t = np.linspace(0, period, num_samples, endpoint=False)
-        return amplitude_v * np.sin(2 * np.pi * frequency * t)
+        return amplitude_v * self._unit_sinewave(frequency, sample_rate)
     
     def start_generation(self) -> str:
         """Start continuous sine wave generation. Returns status message."""
@@ -169,7 +262,7 @@ class MultiCardGenerator:
             return "Generator already running"
         
         # Check if any channels are enabled
-        enabled_channels = [ch for ch in self.channels if ch.enabled]
+        enabled_channels = int(np.count_nonzero(self._enabled))
         if not enabled_channels:
             return "No channels enabled. Please enable at least one channel."
         
@@ -178,7 +271,7 @@ class MultiCardGenerator:
         self.output_thread = Thread(target=self._output_worker, daemon=True)
         self.output_thread.start()
         
-        return f"Started generation on {len(enabled_channels)} channel(s)"
+        return f"Started generation on {enabled_channels} channel(s)"
     
     def stop_generation(self):
         """Stop all sine wave generation."""
@@ -186,6 +279,7 @@ class MultiCardGenerator:
             return
         
         self.stop_event.set()
+        self._dirty.set()
         self.running = False
         
         # Wait for thread to finish
@@ -193,91 +287,171 @@ class MultiCardGenerator:
             self.output_thread.join(timeout=2.0)
         
         # Close all tasks
-        for task_name, task in list(self.tasks.items()):
+        for card_name in list(self.tasks):
+            self._close_card(card_name)
+    
+    def _write_card(self, card_name: str, waveforms: np.ndarray):
+        """Write a card's (channels x samples) buffer through its stream writer."""
+        # The buffer is already C-contiguous float64, so the stream writer
+        # hands it straight to DAQmx; a single channel writes its 1D row
+        self._writers[card_name].write_many_sample(waveforms[0] if len(waveforms) == 1 else waveforms)
+    
+    def _fill_card(self, card_name: str, amps_v: np.ndarray, freq: float, srate: int) -> np.ndarray:
+        """Scale the shared unit table into the card's preallocated buffer."""
+        samples = self._unit_sinewave(freq, srate)  # 1V reference
+        waveforms = self._card_buffers.get(card_name)
+        if waveforms is None or waveforms.shape != (len(amps_v), len(samples)):
+            waveforms = np.empty((len(amps_v), len(samples)))
+            self._card_buffers[card_name] = waveforms
+        # One (channels x samples) outer product of the shared table
+        np.multiply.outer(amps_v, samples, out=waveforms)
+        return waveforms
+    
+    @staticmethod
+    def _close_task(description: str, task: nidaqmx.Task):
+        """Stop and close a task, reporting (not raising) driver errors."""
+        try:
+            task.stop()
+        except (nidaqmx.DaqError, RuntimeError) as e:
+            print(f"  WARNING: Stopping {description} task failed: {e}")
+        try:
+            task.close()
+        except (nidaqmx.DaqError, RuntimeError) as e:
+            print(f"  WARNING: Closing {description} task failed - it may leak driver resources: {e}")
+    
+    def _close_card(self, card_name: str):
+        """Stop and forget the task of one card."""
+        task = self.tasks.pop(card_name, None)
+        self._card_buffers.pop(card_name, None)
+        self._writers.pop(card_name, None)
+        self._card_state.pop(card_name, None)
+        if task is not None:
+            self._close_task(card_name, task)
+    
+    def _update_card(self, card_name: str, ch_nums: np.ndarray, amps_v: np.ndarray,
+                     freq: float, srate: int):
+        """Create the task of a card, or bring its running task up to date."""
+        task = self.tasks.get(card_name)
+        
+        # Create task if it doesn't exist
+        if task is None:
             try:
+                task = nidaqmx.Task()
+                
+                # Add all channels for this card
+                for ch_num in ch_nums.tolist():
+                    task.ao_channels.add_ao_voltage_chan(
+                        f"{card_name}/ao{ch_num}",
+                        min_val=-10.0,
+                        max_val=10.0
+                    )
+                
+                # Generate waveforms for each channel with individual amplitudes
+                waveforms = self._fill_card(card_name, amps_v, freq, srate)
+                
+                # Configure timing
+                task.timing.cfg_samp_clk_timing(
+                    rate=srate,
+                    sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
+                    samps_per_chan=waveforms.shape[1]
+                )
+                task.out_stream.regen_mode = nidaqmx.constants.RegenerationMode.ALLOW_REGENERATION
+                writer_cls = AnalogMultiChannelWriter if len(ch_nums) > 1 else AnalogSingleChannelWriter
+                self._writers[card_name] = writer_cls(task.out_stream, auto_start=False)
+                
+                # Write interleaved data
+                self._write_card(card_name, waveforms)
+                task.start()
+                
+                self.tasks[card_name] = task
+                self._card_state[card_name] = (tuple(ch_nums.tolist()), freq, srate, amps_v)
+                
+            except Exception as e:
+                print(f"Error creating task for {card_name}: {e}")
+                # Release the half-built task; the worker retries from scratch
+                self._writers.pop(card_name, None)
+                if task is not None:
+                    self._close_task(card_name, task)
+            return
+        
+        state = self._card_state[card_name]
+        try:
+            if state[1:3] != (freq, srate):
+                # Clock or period change - stop, retime, rewrite, restart
+                waveforms = self._fill_card(card_name, amps_v, freq, srate)
                 task.stop()
-                task.close()
-            except:
-                pass
-        self.tasks.clear()
+                task.timing.cfg_samp_clk_timing(
+                    rate=srate,
+                    sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
+                    samps_per_chan=waveforms.shape[1]
+                )
+                self._write_card(card_name, waveforms)
+                task.start()
+            elif not np.array_equal(state[3], amps_v):
+                # Amplitudes only - overwrite the regenerated buffer in
+                # place while the task keeps running
+                self._write_card(card_name, self._fill_card(card_name, amps_v, freq, srate))
+            else:
+                return
+            self._card_state[card_name] = (state[0], freq, srate, amps_v)
+        except Exception as e:
+            print(f"Error updating task for {card_name}: {e}")
+    
+    def _for_each_card(self, func, items) -> list:
+        """
+        Call func(*item) for each item, one card per thread.
+        
+        Cards are independent and DAQmx calls release the GIL, so configuring
+        them concurrently costs about as long as configuring one.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(*item) for item in items]
+        with ThreadPoolExecutor(max_workers=len(items)) as pool:
+            return list(pool.map(lambda item: func(*item), items))
     
     def _output_worker(self):
         """Background thread that manages continuous output."""
         try:
             while not self.stop_event.is_set():
-                with self.lock:
-                    freq = self.frequency
-                    srate = self.sample_rate
-                    # Create copy of enabled channels
-                    enabled_chs = [(ch.card_name, ch.channel_number, ch.amplitude_uv) 
-                                  for ch in self.channels if ch.enabled]
+                # Lock-free read of the published settings, one row per card
+                params = self._params
+                freq = params.frequency
+                srate = params.sample_rate
+                enabled = params.enabled.reshape(len(self.CARD_NAMES), -1)
+                amps = params.amp_uv.reshape(len(self.CARD_NAMES), -1) * 1e-6  # uV -> V
                 
-                # Group channels by card
-                cards = {}
-                for card_name, ch_num, amp_uv in enabled_chs:
-                    if card_name not in cards:
-                        cards[card_name] = []
-                    cards[card_name].append((ch_num, amp_uv))
+                # Group channels by card: enabled channel numbers and their amplitudes
+                cards = {self.CARD_NAMES[c]: (np.flatnonzero(enabled[c]), amps[c, enabled[c]])
+                         for c in np.flatnonzero(enabled.any(axis=1)).tolist()}
                 
-                # Update tasks for each card
-                for card_name, channel_list in cards.items():
-                    task_name = card_name
-                    
-                    # Create task if it doesn't exist
-                    if task_name not in self.tasks:
-                        try:
-                            task = nidaqmx.Task()
-                            
-                            # Add all channels for this card
-                            for ch_num, _ in channel_list:
-                                task.ao_channels.add_ao_voltage_chan(
-                                    f"{card_name}/ao{ch_num}",
-                                    min_val=-10.0,
-                                    max_val=10.0
-                                )
-                            
-                            # Configure timing
-                            period = 1.0 / freq
-                            samples = self.generate_sinewave(freq, 1.0, srate)  # 1V reference
-                            
-                            task.timing.cfg_samp_clk_timing(
-                                rate=srate,
-                                sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
-                                samps_per_chan=len(samples)
-                            )
-                            task.out_stream.regen_mode = nidaqmx.constants.RegenerationMode.ALLOW_REGENERATION
-                            
-                            # Generate waveforms for each channel with individual amplitudes
-                            waveforms = []
-                            for ch_num, amp_uv in channel_list:
-                                amp_v = amp_uv / 1e6  # Convert microvolts to volts
-                                waveform = self.generate_sinewave(freq, amp_v, srate)
-                                waveforms.append(waveform)
-                            
-                            # Write interleaved data
-                            task.write(waveforms, auto_start=False)
-                            task.start()
-                            
-                            self.tasks[task_name] = task
-                            
-                        except Exception as e:
-                            print(f"Error creating task for {card_name}: {e}")
-                            continue
+                # Cards whose channel list changed (or that have none left) need a new task
+                for card_name in list(self.tasks):
+                    if card_name not in cards or \
+                            self._card_state[card_name][0] != tuple(cards[card_name][0].tolist()):
+                        self._close_card(card_name)
                 
-                # Sleep for a bit before checking for updates
-                time.sleep(0.1)
+                # Update tasks for each card, cards in parallel. Build the shared
+                # table first so the card threads only read the cache
+                self._unit_sinewave(freq, srate)
+                self._for_each_card(self._update_card,
+                                    [(card_name, ch_nums, amps_v, freq, srate)
+                                     for card_name, (ch_nums, amps_v) in cards.items()])
+                
+                # Park until a setter publishes new settings (or stop is requested);
+                # the timeout retries cards whose task creation failed
+                self._dirty.wait(timeout=1.0)
+                self._dirty.clear()
         
         except Exception as e:
             print(f"Output worker error: {e}")
         finally:
             # Clean up
-            for task in list(self.tasks.values()):
-                try:
-                    task.stop()
-                    task.close()
-                except:
-                    pass
-            self.tasks.clear()
+            for card_name in list(self.tasks):
+                self._close_card(card_name)
+
+
+def connect_to_chassis():
     """Connect to the PXIe chassis over Thunderbolt and list available devices."""
     try:
         # Create a system object to interact with NI-DAQmx
@@ -318,7 +492,20 @@ class MultiCardGenerator:
         return None
 
 
-def generate_sinewave(frequency, amplitude, sample_rate, duration, offset=0.0):
+# Sample indices 0, 1, 2, ... shared by the generators; grown on demand
+_sample_index = np.arange(0, dtype=np.float64)
+
+
+def _indices(num_samples):
+    """Return a read-only view of the first num_samples sample indices."""
+    global _sample_index
+    if len(_sample_index) < num_samples:
+        _sample_index = np.arange(num_samples, dtype=np.float64)
+        _sample_index.setflags(write=False)
+    return _sample_index[:num_samples]
+
+
+def generate_sinewave(frequency, amplitude, sample_rate, duration, offset=0.0, out=None):
     """
     Generate a sine wave signal with optional DC offset.
     
@@ -328,16 +515,107 @@ def generate_sinewave(frequency, amplitude, sample_rate, duration, offset=0.0):
         sample_rate: Samples per second
         duration: Duration in seconds
         offset: DC offset in volts (default: 0.0)
+        out: Optional float64 array of int(sample_rate * duration) samples
+             to write into (default: None)
     
     Returns:
-        numpy array of sine wave samples
+        numpy array of sine wave samples (out itself when given, otherwise a
+        new array owned by the caller)
     """
     num_samples = int(sample_rate * duration)
-    t = np.linspace(0, duration, num_samples, endpoint=False)
-    sine_wave = offset + amplitude * np.sin(2 * np.pi * frequency * t)
+    sine_wave = np.empty(num_samples) if out is None else out
+    
+    # Phase advances by 2*pi*f/fs per sample; evaluate everything in place
+    np.multiply(_indices(num_samples), 2 * np.pi * frequency / sample_rate, out=sine_wave)
+    np.sin(sine_wave, out=sine_wave)
+    sine_wave *= amplitude
+    sine_wave += offset
     return sine_wave
 
 
+# High-resolution unit sine covering one cycle, plus a guard point so linear
+# interpolation never needs to wrap. Interpolation error is below 2e-8.
+_SINE_LUT_SIZE = 16384
+_SINE_LUT = np.sin(np.arange(_SINE_LUT_SIZE + 1) * (2 * np.pi / _SINE_LUT_SIZE))
+
+# Unit-amplitude one-period sine tables, keyed by samples per period (LRU).
+# The slider grid maps every (frequency, sample rate) pair onto one of these,
+# and at 200 kS/s / 10 Hz a table is only 80 kB, so keep enough to make
+# revisited slider positions a plain multiply. Tables are float32 (rounding
+# stays below the 24-bit DAC step); scaling widens them to the float64 DAQmx
+# writes.
+_BASE_SINE_SLOTS = 128
+_base_sines: "OrderedDict[int, np.ndarray]" = OrderedDict()
+
+
+def _phase_coherent_n(frequency, sample_rate):
+    """
+    Number of samples holding exactly one whole cycle at the given rate.
+    
+    The buffer is regenerated end-to-end by the device, so it must close the
+    phase exactly; the generated frequency is therefore sample_rate / N.
+    """
+    return max(int(sample_rate // frequency), 2)
+
+
+def _base_sinewave(num_samples):
+    """Return the cached unit-amplitude single-period sine of num_samples samples."""
+    base = _base_sines.get(num_samples)
+    if base is None:
+        # Phase-index into the LUT instead of evaluating sin per sample
+        phase = _indices(num_samples) * (_SINE_LUT_SIZE / num_samples)
+        index = phase.astype(np.intp)
+        phase -= index  # fractional part
+        base = _SINE_LUT[index]
+        base += (_SINE_LUT[index + 1] - base) * phase
+        base = base.astype(np.float32)
+        base.setflags(write=False)
+        _base_sines[num_samples] = base
+        if len(_base_sines) > _BASE_SINE_SLOTS:
+            _base_sines.popitem(last=False)
+    else:
+        _base_sines.move_to_end(num_samples)
+    return base
+
+
+def _signal_stats(data):
+    """Return (min, max, rms, peak) of data without building temporary arrays."""
+    data_min = data.min()
+    data_max = data.max()
+    rms = np.sqrt(float(np.dot(data, data)) / len(data))
+    return data_min, data_max, rms, max(data_max, -data_min)
+
+
+def _decimate_minmax(data, starts, out):
+    """
+    Reduce data to per-bucket (min, max) pairs for plotting.
+    
+    starts holds the first sample index of each bucket (ascending, starting at
+    0), so every sample falls in a bucket; out holds 2 * len(starts) values.
+    """
+    np.minimum.reduceat(data, starts, out=out[0::2])
+    np.maximum.reduceat(data, starts, out=out[1::2])
+    return out
+
+
+def _pin_current_thread(slot):
+    """
+    Pin the calling thread to one CPU of the process's allowed set.
+    
+    slot indexes that set (negative counts from the end). Only done on Linux
+    with at least three allowed CPUs, so the GUI thread keeps the rest.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < 3:
+        return
+    try:
+        os.sched_setaffinity(0, {cpus[slot]})  # pid 0 = calling thread on Linux
+    except OSError:
+        pass
+
+
 def output_continuous_sinewave(device_name="Dev1", channel="ao1", 
                                frequency=50000.0, amplitude=0.1, 
                                sample_rate=1000000):
@@ -352,9 +630,9 @@ def output_continuous_sinewave(device_name="Dev1", channel="ao1",
         sample_rate: Sample rate in Hz (default: 50000 Hz)
     """
     try:
-        # Generate one period of the sine wave
-        period = 1.0 / frequency
-        samples = generate_sinewave(frequency, amplitude, sample_rate, period)
+        # Generate one phase-continuous period of the sine wave
+        num_samples = _phase_coherent_n(frequency, sample_rate)
+        samples = np.multiply(_base_sinewave(num_samples), amplitude, dtype=np.float64)
         
         print(f"Configuring {device_name}/{channel}:")
         print(f"  Frequency: {frequency} Hz")
@@ -400,9 +678,71 @@ def output_continuous_sinewave(device_name="Dev1", channel="ao1",
         print(f"\nError: {e}")
 
 
+class BlitManager:
+    """
+    Redraw a fixed set of animated artists over a cached background.
+    
+    The background is re-captured on every full draw (draw_event), so resizes,
+    axis-limit changes and widget redraws are picked up automatically.
+    """
+    
+    def __init__(self, canvas, animated_artists=()):
+        self.canvas = canvas
+        self._bg = None
+        self._artists = []
+        for artist in animated_artists:
+            self.add_artist(artist)
+        self._cid = canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def on_draw(self, event):
+        """Capture the static background and paint the artists over it."""
+        if event is not None and event.canvas != self.canvas:
+            raise RuntimeError("draw_event from an unexpected canvas")
+        self._bg = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_animated()
+    
+    def add_artist(self, artist):
+        """Add an artist that must belong to this canvas's figure."""
+        if artist.figure != self.canvas.figure:
+            raise RuntimeError("artist belongs to a different figure")
+        artist.set_animated(True)
+        self._artists.append(artist)
+    
+    def _draw_animated(self):
+        fig = self.canvas.figure
+        for artist in self._artists:
+            fig.draw_artist(artist)
+    
+    def update(self):
+        """Restore the background, redraw the artists and blit the figure."""
+        if self._bg is None:
+            # No full draw has happened yet; do one now. Its draw_event captures
+            # the background and paints the artists before it is shown
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self.canvas.figure.bbox)
+
+
 class InteractiveOscilloscope:
     """Interactive oscilloscope with real-time controls."""
     
+    INFO_TEMPLATE = ('Output: {:.1f} Hz, {:.2f} V, Offset: {:.2f} V @ {:.0f} kS/s\n'
+                     'Samples/Cycle: {:.1f} | Input RMS: {:.3f} V | Peak: {:.3f} V')
+    INFO_TEMPLATE_NO_DATA = 'Output: {:.1f} Hz, {:.2f} V, Offset: {:.2f} V\nSamples/Cycle: {:.1f}'
+    
+    # Warning readout by samples-per-cycle level: < 2, < 10, < 20, otherwise
+    WARNING_LIMITS = (2, 10, 20)
+    WARNINGS = (
+        '⚠ ERROR\nInvalid!\n({:.1f} samples/cycle)\nMUST be ≥ 2\nReduce frequency!',
+        '⚠ WARNING\nLow Quality\n({:.1f} samples/cycle)\nIncrease sample rate\nor decrease frequency',
+        '⚠ CAUTION\nModerate Quality\n({:.1f} samples/cycle)',
+        '',
+    )
+    
+    OUTPUT_UPDATE_INTERVAL = 0.05  # Minimum seconds between AO rewrites while dragging
+    
     def __init__(self, device_name="Dev1", ao_channel="ao1", ai_channel="ai1",
                  initial_frequency=1000.0, initial_amplitude=1.0, sample_rate=50000):
         """
@@ -422,7 +762,8 @@ class InteractiveOscilloscope:
         self.sample_rate = sample_rate
         self.display_samples = 5000
         
-        # Signal parameters (thread-safe)
+        # Signal parameters. Tk callbacks assign single floats (atomic under
+        # the GIL); the lock only guards the sample rate + changed flag pair.
         self.lock = Lock()
         self.frequency = initial_frequency
         self.amplitude = initial_amplitude
@@ -434,18 +775,47 @@ class InteractiveOscilloscope:
         self.auto_scale = True
         
         # Data buffers
-        self.input_data = np.zeros(self.display_samples)
+        # Single-producer/single-consumer ring: acquisition_thread writes samples
+        # and then publishes _head; animate copies the newest window into
+        # input_data. Only the producer ever assigns _head. The display path is
+        # float32 (ample for a ~1 mV trace); DAQmx itself only takes float64.
+        self._ring = np.zeros(self.display_samples * 4, dtype=np.float32)
+        self._head = 0
+        self.input_data = np.zeros(self.display_samples, dtype=np.float32)
+        self._ai_buf = np.empty(self.display_samples)  # DAQmx reads land here directly
+        # (min, max, rms, peak) of the latest display window, computed by the
+        # acquisition thread and replaced as one tuple so animate() only reads it
+        self._stats = _signal_stats(self.input_data)
+        self._ao_buf = None
         self.stop_event = Event()
+        self._dirty = Event()  # Set by slider callbacks to wake the output thread
+        # Set by each I/O thread once its task is running (or it gave up)
+        self._ao_ready = Event()
+        self._ai_ready = Event()
         self.ao_task = None
         self.ai_task = None
         
-        # Set up the plot with controls
-        self.fig = plt.figure(figsize=(15, 9))
+        # Set up the window: the figure holds only the plot, while the controls
+        # are native Tk widgets so dragging them never repaints the figure
+        self.root = tk.Tk()
+        self.root.title("Interactive Oscilloscope")
+        self.root.protocol("WM_DELETE_WINDOW", self.root.quit)
+        
+        self.fig = Figure(figsize=(15, 6))
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.root)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         
-        # Main plot area - adjusted to make room for more controls
-        self.ax = plt.axes([0.1, 0.35, 0.85, 0.55])
-        self.line, = self.ax.plot(self.input_data, 'b-', linewidth=1)
+        # Main plot area
+        self.ax = self.fig.add_axes([0.07, 0.1, 0.9, 0.82])
+        # Animated artists are left out of full redraws and blitted each frame
+        self.line, = self.ax.plot(self.input_data, 'b-', linewidth=1, animated=True)
         self.ax.set_ylim(self.y_min, self.y_max)
+        self._last_ylim = (self.y_min, self.y_max)
+        
+        # Draw at most two points (min/max) per horizontal pixel
+        self._full_x = np.arange(self.display_samples)
+        self._update_decimation()
+        self.fig.canvas.mpl_connect('resize_event', self._update_decimation)
         self.ax.set_xlim(0, self.display_samples)
         self.ax.set_ylabel('Voltage (V)', fontsize=11)
         self.ax.set_title(f'Interactive Oscilloscope - Output: {ao_channel} | Input: {ai_channel}', 
@@ -455,188 +825,295 @@ class InteractiveOscilloscope:
         time_span = self.display_samples / sample_rate
         self.ax.set_xlabel(f'Samples (Time span: {time_span*1000:.1f} ms)', fontsize=11)
         
-        # Output Generator Controls Section
-        gen_label_y = 0.29
-        self.fig.text(0.05, gen_label_y, 'Generator Output:', fontsize=11, fontweight='bold')
-        
-        ax_freq = plt.axes([0.15, 0.25, 0.7, 0.02])
-        ax_amp = plt.axes([0.15, 0.22, 0.7, 0.02])
-        ax_offset = plt.axes([0.15, 0.19, 0.7, 0.02])
+        controls = ttk.Frame(self.root, padding=(10, 5))
+        controls.pack(side=tk.BOTTOM, fill=tk.X)
+        controls.columnconfigure(1, weight=1)
+        self._scale_last = {}  # Per slider variable: [value in effect] (see _add_scale)
         
-        self.slider_freq = Slider(ax_freq, 'Frequency (Hz)', 10, 50000, 
-                                   valinit=initial_frequency, valstep=10)
-        self.slider_amp = Slider(ax_amp, 'Amplitude (V)', 0.0, 10.0, 
-                                  valinit=initial_amplitude, valstep=0.1)
-        self.slider_offset = Slider(ax_offset, 'DC Offset (V)', -10.0, 10.0,
-                                     valinit=0.0, valstep=0.1)
+        # Output Generator Controls Section
+        ttk.Label(controls, text='Generator Output:', font=('TkDefaultFont', 11, 'bold')).grid(
+            row=0, column=0, sticky=tk.W)
+        self.var_freq = self._add_scale(controls, 1, 'Frequency (Hz)', 10, 50000,
+                                        initial_frequency, 10, self.update_frequency)
+        self.var_amp = self._add_scale(controls, 2, 'Amplitude (V)', 0.0, 10.0,
+                                       initial_amplitude, 0.1, self.update_amplitude)
+        self.var_offset = self._add_scale(controls, 3, 'DC Offset (V)', -10.0, 10.0,
+                                          0.0, 0.1, self.update_offset)
         
         # Oscilloscope Controls Section
-        scope_label_y = 0.16
-        self.fig.text(0.05, scope_label_y, 'Oscilloscope:', fontsize=11, fontweight='bold')
-        
-        ax_srate = plt.axes([0.15, 0.12, 0.7, 0.02])
-        ax_ymin = plt.axes([0.15, 0.08, 0.7, 0.02])
-        ax_ymax = plt.axes([0.15, 0.04, 0.7, 0.02])
-        
-        self.slider_srate = Slider(ax_srate, 'Sample Rate (Hz)', 1000, 200000,
-                                    valinit=sample_rate, valstep=1000)
-        self.slider_ymin = Slider(ax_ymin, 'Y Min (V)', -20, 0, 
-                                   valinit=self.y_min, valstep=0.5)
-        self.slider_ymax = Slider(ax_ymax, 'Y Max (V)', 0, 20, 
-                                   valinit=self.y_max, valstep=0.5)
+        ttk.Label(controls, text='Oscilloscope:', font=('TkDefaultFont', 11, 'bold')).grid(
+            row=4, column=0, sticky=tk.W)
+        self.var_srate = self._add_scale(controls, 5, 'Sample Rate (Hz)', 1000, 200000,
+                                         sample_rate, 1000, self.update_sample_rate)
+        self.var_ymin = self._add_scale(controls, 6, 'Y Min (V)', -20, 0,
+                                        self.y_min, 0.5, self.update_ymin)
+        self.var_ymax = self._add_scale(controls, 7, 'Y Max (V)', 0, 20,
+                                        self.y_max, 0.5, self.update_ymax)
         
         # Auto-scale button
-        ax_auto = plt.axes([0.88, 0.08, 0.1, 0.04])
-        self.btn_auto = Button(ax_auto, 'Auto Scale')
-        
-        # Connect slider callbacks
-        self.slider_freq.on_changed(self.update_frequency)
-        self.slider_amp.on_changed(self.update_amplitude)
-        self.slider_offset.on_changed(self.update_offset)
-        self.slider_srate.on_changed(self.update_sample_rate)
-        self.slider_ymin.on_changed(self.update_ymin)
-        self.slider_ymax.on_changed(self.update_ymax)
-        self.btn_auto.on_clicked(self.toggle_auto_scale)
+        ttk.Button(controls, text='Auto Scale', command=self.toggle_auto_scale).grid(
+            row=6, column=3, rowspan=2, padx=10)
         
         # Add info text
         self.info_text = self.ax.text(0.02, 0.98, '', transform=self.ax.transAxes,
-                                      verticalalignment='top', fontsize=9,
+                                      verticalalignment='top', fontsize=9, animated=True,
                                       bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         # Add warning text (initially hidden)
         self.warning_text = self.ax.text(0.98, 0.98, '', transform=self.ax.transAxes,
                                          verticalalignment='top', horizontalalignment='right',
-                                         fontsize=9, color='red', fontweight='bold',
+                                         fontsize=9, color='red', fontweight='bold', animated=True,
                                          bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.8))
         
+        # Blit the trace and readouts each frame; the manager re-captures the
+        # background on every full draw (resize, Y limits, widget redraws)
+        self._bm = BlitManager(self.fig.canvas, [self.line, self.info_text, self.warning_text])
+        self._anim_timer = self.fig.canvas.new_timer(interval=50)
+        self._anim_timer.add_callback(self._tick)
+        
+        # Keys of the last rendered readouts (see animate)
+        self._last_info = self._last_warn = None
+        self._info_div = -1  # First frame fills the readouts
+        # Ring head last drawn; animate skips the trace until it moves. _stale
+        # marks artists changed since the last blit
+        self._drawn_head = -1
+        self._stale = True
+        
+        # Push auto-scaled limits back to the Y sliders at 1 Hz, outside the blit loop
+        self._slider_timer = self.fig.canvas.new_timer(interval=1000)
+        self._slider_timer.add_callback(self._sync_ylim_sliders)
+        
+        # Sample-rate drags rebuild the DAQmx tasks, so only apply the value
+        # once the slider has been still for 75 ms
+        self._pending_rate = None
+        self._rate_timer = self.fig.canvas.new_timer(interval=75)
+        self._rate_timer.single_shot = True
+        self._rate_timer.add_callback(self._commit_sample_rate)
+        
+    def _add_scale(self, parent, row, text, low, high, value, step, callback):
+        """
+        Add a labelled ttk.Scale snapped to multiples of step.
+        
+        callback receives the snapped value, once per change. Returns the
+        DoubleVar backing the scale; set it through _set_scale so the change
+        check stays in step (that does not invoke callback).
+        """
+        var = tk.DoubleVar(value=value)
+        readout = ttk.Label(parent, text=f'{value:g}', width=8, anchor=tk.E)
+        last = self._scale_last[str(var)] = [value]  # Value the app currently uses
+        
+        def snap(raw):
+            return round(round(float(raw) / step) * step, 6)
+        
+        def on_move(raw):
+            snapped = snap(raw)
+            if snapped == last[0]:
+                return
+            last[0] = snapped
+            callback(snapped)
+        
+        def on_var(*_):
+            # Fires before on_move during drags, so show the snapped value
+            # rather than the raw slider position
+            readout.config(text=f'{snap(var.get()):g}')
+        
+        var.trace_add('write', on_var)
+        ttk.Label(parent, text=text).grid(row=row, column=0, sticky=tk.W, padx=(20, 5))
+        ttk.Scale(parent, from_=low, to=high, orient=tk.HORIZONTAL, variable=var,
+                  command=on_move).grid(row=row, column=1, sticky=tk.EW, pady=2)
+        readout.grid(row=row, column=2, sticky=tk.E)
+        return var
+    
     def update_frequency(self, val):
         """Callback for frequency slider."""
-        with self.lock:
-            self.frequency = val
+        self.frequency = val
+        self._dirty.set()
     
     def update_amplitude(self, val):
         """Callback for amplitude slider."""
-        with self.lock:
-            self.amplitude = val
+        self.amplitude = val
+        self._dirty.set()
     
     def update_offset(self, val):
         """Callback for DC offset slider."""
-        with self.lock:
-            self.offset = val
+        self.offset = val
+        self._dirty.set()
     
     def update_sample_rate(self, val):
-        """Callback for sample rate slider."""
+        """Callback for sample rate slider (debounced)."""
+        self._pending_rate = int(val)
+        self._rate_timer.stop()
+        self._rate_timer.start()
+    
+    def _commit_sample_rate(self):
+        """Apply the last sample rate seen during a slider drag."""
+        if self._pending_rate is None:
+            return
         with self.lock:
-            self.sample_rate_value = int(val)
+            self.sample_rate_value = self._pending_rate
             self.sample_rate_changed = True
+        self._pending_rate = None
+        self._dirty.set()
         # Update time span label
         time_span = self.display_samples / self.sample_rate_value
         self.ax.set_xlabel(f'Samples (Time span: {time_span*1000:.1f} ms)', fontsize=11)
+        self.canvas.draw_idle()
     
     def update_ymin(self, val):
         """Callback for Y-min slider."""
         self.y_min = val
         self.auto_scale = False
-        self.ax.set_ylim(self.y_min, self.y_max)
+        self._apply_ylim(self.y_min, self.y_max)
     
     def update_ymax(self, val):
         """Callback for Y-max slider."""
         self.y_max = val
         self.auto_scale = False
-        self.ax.set_ylim(self.y_min, self.y_max)
+        self._apply_ylim(self.y_min, self.y_max)
+    
+    def _update_decimation(self, event=None):
+        """Size the min/max display decimation to the plot width in pixels."""
+        bins = int(self.ax.bbox.width)
+        if bins > 0 and self.display_samples > 2 * bins:
+            # Near-equal buckets covering every sample; each (min, max) pair is
+            # drawn from its bucket's first to last sample so the trace spans
+            # the whole window
+            edges = np.linspace(0, self.display_samples, bins + 1).astype(np.intp)
+            self._decim_starts = edges[:-1]
+            self._decim_x = np.column_stack((edges[:-1], edges[1:] - 1)).ravel()
+            self._decim_y = np.empty(2 * bins, dtype=np.float32)
+        else:
+            self._decim_starts = None
+            self._decim_x = None
+            self._decim_y = None
+        self._drawn_head = -1  # Redo the trace at the new resolution
+    
+    def _apply_ylim(self, y_min, y_max):
+        """Change the Y limits and redraw the static background once."""
+        self.ax.set_ylim(y_min, y_max)
+        self._last_ylim = (y_min, y_max)
+        # Full draw so the blit background picks up the new ticks
+        self.fig.canvas.draw()
     
-    def toggle_auto_scale(self, event):
+    def _sync_ylim_sliders(self):
+        """Reflect auto-scaled limits on the Y sliders without triggering callbacks."""
+        if not self.auto_scale:
+            return
+        for var, value in ((self.var_ymin, self.y_min), (self.var_ymax, self.y_max)):
+            if var.get() != value:
+                self._set_scale(var, value)
+    
+    def _set_scale(self, var, value):
+        """Move a slider made by _add_scale without invoking its callback."""
+        # The next drag is then compared against the value now in effect
+        self._scale_last[str(var)][0] = value
+        var.set(value)
+    
+    def toggle_auto_scale(self, event=None):
         """Toggle auto-scaling."""
         self.auto_scale = not self.auto_scale
         status = "ON" if self.auto_scale else "OFF"
         print(f"Auto-scale: {status}")
     
+    def _fill_output(self, freq, amp, offset, srate):
+        """Scale the cached single-period sine into the reusable output buffer."""
+        base = _base_sinewave(_phase_coherent_n(freq, srate))
+        if self._ao_buf is None or len(self._ao_buf) != len(base):
+            self._ao_buf = np.empty(len(base))
+        np.multiply(base, amp, out=self._ao_buf, dtype=np.float64)
+        if offset:
+            self._ao_buf += offset
+        return self._ao_buf
+    
     def output_thread(self):
         """Background thread for analog output."""
+        _pin_current_thread(-1)
         current_task = None
+        last_srate = None
         try:
             while not self.stop_event.is_set():
-                # Get current parameters
+                updated_at = time.monotonic()
+                # Get current parameters. Scalar attribute reads are atomic;
+                # only the sample rate and its change flag need the lock.
+                freq = self.frequency
+                amp = self.amplitude
+                offset = self.offset
                 with self.lock:
-                    freq = self.frequency
-                    amp = self.amplitude
-                    offset = self.offset
                     srate = self.sample_rate_value
-                    rate_changed = self.sample_rate_changed
                     self.sample_rate_changed = False
                 
                 # Ensure minimum samples per cycle (at least 2, but prefer 10 minimum)
                 samples_per_cycle = srate / freq
                 if samples_per_cycle < 2:
                     print(f"WARNING: Frequency too high ({freq} Hz) for sample rate ({srate} Hz). Skipping update.")
-                    time.sleep(0.1)
+                    self._dirty.wait(timeout=0.25)
+                    self._dirty.clear()
                     continue
                 
-                # Create new task if needed (initial or sample rate changed)
-                if current_task is None or rate_changed:
-                    if current_task is not None:
-                        try:
-                            current_task.stop()
-                            current_task.close()
-                        except:
-                            pass
-                    
-                    current_task = nidaqmx.Task()
-                    self.ao_task = current_task
-                    current_task.ao_channels.add_ao_voltage_chan(f"{self.device_name}/{self.ao_channel}")
-                    
-                    period = 1.0 / freq
-                    samples = generate_sinewave(freq, amp, srate, period, offset)
+                # Create the task once; a sample rate change only retimes it.
+                # Compare against the rate the task is clocked at, so a change
+                # made while updates were being skipped is not lost
+                if current_task is None or srate != last_srate:
+                    samples = self._fill_output(freq, amp, offset, srate)
                     
-                    # Ensure at least 2 samples
-                    if len(samples) < 2:
-                        print(f"ERROR: Not enough samples ({len(samples)}). Skipping.")
-                        continue
+                    if current_task is None:
+                        current_task = nidaqmx.Task()
+                        self.ao_task = current_task
+                        current_task.ao_channels.add_ao_voltage_chan(f"{self.device_name}/{self.ao_channel}")
+                        current_task.out_stream.regen_mode = nidaqmx.constants.RegenerationMode.ALLOW_REGENERATION
+                        writer = AnalogSingleChannelWriter(current_task.out_stream, auto_start=False)
+                    else:
+                        current_task.stop()
                     
                     current_task.timing.cfg_samp_clk_timing(
                         rate=srate,
                         sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
                         samps_per_chan=len(samples)
                     )
-                    current_task.out_stream.regen_mode = nidaqmx.constants.RegenerationMode.ALLOW_REGENERATION
-                    current_task.write(samples, auto_start=False)
+                    writer.write_many_sample(samples)
                     current_task.start()
+                    self._ao_ready.set()
                     
                     last_freq = freq
                     last_amp = amp
                     last_offset = offset
-                    last_srate = srate
+                    last_n = len(samples)
                     
-                    if rate_changed:
+                    if last_srate is not None:
                         print(f"Sample rate changed to {srate} Hz")
+                    last_srate = srate
                 else:
                     # Update waveform if frequency, amplitude, or offset changed
                     if freq != last_freq or amp != last_amp or offset != last_offset:
-                        period = 1.0 / freq
-                        samples = generate_sinewave(freq, amp, srate, period, offset)
-                        
-                        # Ensure at least 2 samples
-                        if len(samples) < 2:
-                            print(f"ERROR: Not enough samples ({len(samples)}). Skipping.")
-                            time.sleep(0.1)
-                            continue
+                        samples = self._fill_output(freq, amp, offset, srate)
                         
-                        current_task.stop()
-                        
-                        # Reconfigure with new sample count if needed
-                        current_task.timing.cfg_samp_clk_timing(
-                            rate=srate,
-                            sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
-                            samps_per_chan=len(samples)
-                        )
-                        current_task.write(samples, auto_start=False)
-                        current_task.start()
+                        if len(samples) != last_n:
+                            # Period length changed - DAQmx cannot resize the buffer
+                            # of a running task, so stop, retime, rewrite, restart
+                            current_task.stop()
+                            current_task.timing.cfg_samp_clk_timing(
+                                rate=srate,
+                                sample_mode=nidaqmx.constants.AcquisitionType.CONTINUOUS,
+                                samps_per_chan=len(samples)
+                            )
+                            writer.write_many_sample(samples)
+                            current_task.start()
+                            last_n = len(samples)
+                        else:
+                            # Same period length - overwrite the regenerated buffer in
+                            # place while the task keeps running
+                            writer.write_many_sample(samples)
                         
                         last_freq = freq
                         last_amp = amp
                         last_offset = offset
                 
-                time.sleep(0.1)
+                # Park until a slider changes, then hold off until
+                # OUTPUT_UPDATE_INTERVAL has passed since this update so the
+                # rest of a drag coalesces into a single rewrite
+                if self._dirty.wait(timeout=0.25):
+                    self.stop_event.wait(updated_at + self.OUTPUT_UPDATE_INTERVAL - time.monotonic())
+                self._dirty.clear()
             
             if current_task is not None:
                 current_task.stop()
@@ -644,6 +1121,7 @@ class InteractiveOscilloscope:
                 
         except Exception as e:
             print(f"Output error: {e}")
+            self._ao_ready.set()
             if current_task is not None:
                 try:
                     current_task.close()
@@ -652,14 +1130,14 @@ class InteractiveOscilloscope:
     
     def acquisition_thread(self):
         """Background thread for continuous data acquisition."""
+        _pin_current_thread(-2)
         current_task = None
         last_srate = None
         
         try:
             while not self.stop_event.is_set():
                 # Check if sample rate changed
-                with self.lock:
-                    srate = self.sample_rate_value
+                srate = self.sample_rate_value
                 
                 # Recreate task if sample rate changed
                 if current_task is None or srate != last_srate:
@@ -680,17 +1158,25 @@ class InteractiveOscilloscope:
                         samps_per_chan=self.display_samples
                     )
                     
+                    reader = AnalogSingleChannelReader(current_task.in_stream)
                     current_task.start()
+                    self._ai_ready.set()
                     last_srate = srate
                 
-                # Read data
+                # Read data (blocks until the hardware has a full display window,
+                # which takes display_samples / srate seconds, plus some slack)
                 try:
-                    samples = current_task.read(number_of_samples_per_channel=self.display_samples)
-                    self.input_data = np.array(samples)
-                except:
-                    pass  # Handle buffer errors gracefully
-                
-                time.sleep(0.05)
+                    reader.read_many_sample(self._ai_buf,
+                                            number_of_samples_per_channel=self.display_samples,
+                                            timeout=self.display_samples / srate + 1.0)
+                    self._ring_write(self._ai_buf)
+                    # Each read is exactly one display window, so its stats are the
+                    # window's stats; compute them here instead of on the Tk thread
+                    self._stats = _signal_stats(self._ai_buf)
+                except nidaqmx.DaqError as e:
+                    # Handle buffer errors gracefully without spinning
+                    print(f"\nDAQmx read error: {e}")
+                    self.stop_event.wait(0.05)
             
             if current_task is not None:
                 current_task.stop()
@@ -701,61 +1187,115 @@ class InteractiveOscilloscope:
         except Exception as e:
             print(f"\nError in acquisition: {e}")
         finally:
+            self._ai_ready.set()
             if current_task is not None:
                 try:
                     current_task.close()
                 except:
                     pass
     
+    def _ring_write(self, data):
+        """Append acquired samples to the ring buffer (producer side)."""
+        size = len(self._ring)
+        count = len(data)
+        if count > size:
+            data = data[-size:]
+            count = size
+        head = self._head
+        pos = head % size
+        first = min(count, size - pos)
+        self._ring[pos:pos + first] = data[:first]
+        self._ring[:count - first] = data[first:]
+        # Publish only after the samples are in place
+        self._head = head + count
+    
+    def _ring_read_latest(self, out):
+        """Copy the newest len(out) samples into out (consumer side)."""
+        head = self._head
+        count = len(out)
+        if head < count:
+            return False
+        size = len(self._ring)
+        start = (head - count) % size
+        first = min(count, size - start)
+        out[:first] = self._ring[start:start + first]
+        out[first:] = self._ring[:count - first]
+        return True
+    
+    def _tick(self):
+        """Animation timer callback: update the artists and blit them if they changed."""
+        self.animate(None)
+        if self._stale:
+            self._stale = False
+            self._bm.update()
+    
     def animate(self, frame):
         """Animation function to update the plot."""
-        self.line.set_ydata(self.input_data)
+        # Only redo the trace (and auto-scale) when the acquisition thread
+        # has published samples since the last frame
+        head = self._head
+        new_data = head != self._drawn_head
+        if new_data:
+            self._drawn_head = head
+            self._ring_read_latest(self.input_data)
+            if self._decim_x is None:
+                self.line.set_data(self._full_x, self.input_data)
+            else:
+                self.line.set_data(self._decim_x, _decimate_minmax(self.input_data, self._decim_starts, self._decim_y))
+            self._stale = True
         
-        # Auto-scale Y-axis based on data
-        if self.auto_scale and len(self.input_data) > 0:
-            data_min, data_max = np.min(self.input_data), np.max(self.input_data)
+        # Text layout is expensive: refresh the readouts at 5 Hz (every 4th
+        # frame) and only touch the artists when the string actually changes
+        self._info_div += 1
+        refresh_text = self._info_div % 4 == 0
+        
+        # Stats of the window come precomputed from the acquisition thread and
+        # serve both the auto-scale and the readouts; until the first read is
+        # published they describe the zero-filled buffer, so ignore them
+        have_data = head > 0
+        data_min, data_max, rms, peak = self._stats
+        
+        # Auto-scale Y-axis based on data. Changing limits forces a full
+        # (non-blitted) redraw, so only rescale when the signal leaves the
+        # current view or fills less than half of it.
+        if self.auto_scale and have_data and new_data:
             margin = max((data_max - data_min) * 0.1, 0.5)
-            self.y_min = data_min - margin
-            self.y_max = data_max + margin
-            self.ax.set_ylim(self.y_min, self.y_max)
-            
-            # Update sliders without triggering callbacks
-            self.slider_ymin.eventson = False
-            self.slider_ymax.eventson = False
-            self.slider_ymin.set_val(self.y_min)
-            self.slider_ymax.set_val(self.y_max)
-            self.slider_ymin.eventson = True
-            self.slider_ymax.eventson = True
-        
-        # Update info text
-        with self.lock:
+            cur_min, cur_max = self._last_ylim
+            wanted_span = (data_max - data_min) + 2 * margin
+            if data_min < cur_min or data_max > cur_max or wanted_span < 0.5 * (cur_max - cur_min):
+                self.y_min = data_min - margin
+                self.y_max = data_max + margin
+                self._apply_ylim(self.y_min, self.y_max)
+        
+        if refresh_text:
             freq = self.frequency
             amp = self.amplitude
             offset = self.offset
             srate = self.sample_rate_value
-        
-        # Calculate samples per cycle
-        samples_per_cycle = srate / freq if freq > 0 else 0
-        
-        # Generate info text
-        if len(self.input_data) > 0:
-            rms = np.sqrt(np.mean(self.input_data**2))
-            peak = np.max(np.abs(self.input_data))
-            info = f'Output: {freq:.1f} Hz, {amp:.2f} V, Offset: {offset:.2f} V @ {srate/1000:.0f} kS/s\nSamples/Cycle: {samples_per_cycle:.1f} | Input RMS: {rms:.3f} V | Peak: {peak:.3f} V'
-        else:
-            info = f'Output: {freq:.1f} Hz, {amp:.2f} V, Offset: {offset:.2f} V\nSamples/Cycle: {samples_per_cycle:.1f}'
-        
-        self.info_text.set_text(info)
-        
-        # Update warning text based on samples per cycle
-        if samples_per_cycle < 2:
-            self.warning_text.set_text(f'⚠ ERROR\nInvalid!\n({samples_per_cycle:.1f} samples/cycle)\nMUST be ≥ 2\nReduce frequency!')
-        elif samples_per_cycle < 10:
-            self.warning_text.set_text(f'⚠ WARNING\nLow Quality\n({samples_per_cycle:.1f} samples/cycle)\nIncrease sample rate\nor decrease frequency')
-        elif samples_per_cycle < 20:
-            self.warning_text.set_text(f'⚠ CAUTION\nModerate Quality\n({samples_per_cycle:.1f} samples/cycle)')
-        else:
-            self.warning_text.set_text('')  # Clear warning
+            
+            # Calculate samples per cycle
+            samples_per_cycle = srate / freq if freq > 0 else 0
+            
+            # Generate info text, keyed on the values as displayed so an
+            # unchanged readout is neither formatted nor re-laid out
+            info_key = (freq, amp, offset, srate, have_data, round(rms, 3), round(peak, 3))
+            if info_key != self._last_info:
+                if have_data:
+                    info = self.INFO_TEMPLATE.format(freq, amp, offset, srate / 1000,
+                                                     samples_per_cycle, rms, peak)
+                else:
+                    info = self.INFO_TEMPLATE_NO_DATA.format(freq, amp, offset, samples_per_cycle)
+                self.info_text.set_text(info)
+                self._last_info = info_key
+                self._stale = True
+            
+            # Update warning text based on samples per cycle (level 3 clears it)
+            level = bisect_right(self.WARNING_LIMITS, samples_per_cycle)
+            warn_key = (level, round(samples_per_cycle, 1)) if level < 3 else (level,)
+            if warn_key != self._last_warn:
+                self.warning_text.set_text(self.WARNINGS[level].format(samples_per_cycle))
+                self._last_warn = warn_key
+                self._stale = True
         
         return self.line, self.info_text, self.warning_text
     
@@ -769,19 +1309,23 @@ class InteractiveOscilloscope:
         acq_thread = Thread(target=self.acquisition_thread, daemon=True)
         acq_thread.start()
         
-        # Give threads time to start
-        time.sleep(0.5)
+        # Wait until both tasks are running (bounded, in case the hardware is missing)
+        self._ao_ready.wait(timeout=2)
+        self._ai_ready.wait(timeout=2)
         
         # Start animation
-        ani = animation.FuncAnimation(
-            self.fig, self.animate, interval=50, blit=True, cache_frame_data=False
-        )
+        self._anim_timer.start()
+        self._slider_timer.start()
         
-        plt.show()
+        self.root.mainloop()
+        self._slider_timer.stop()
+        self._anim_timer.stop()
         
         # Clean up when window is closed
         self.stop_event.set()
-        time.sleep(0.2)
+        self._dirty.set()
+        out_thread.join(timeout=1)
+        acq_thread.join(timeout=1)
         if self.ao_task:
             try:
                 self.ao_task.stop()
@@ -792,6 +1336,7 @@ class InteractiveOscilloscope:
                 self.ai_task.stop()
             except:
                 pass
+        self.root.destroy()
 
 
 def run_interactive_oscilloscope(device_name="Dev1", ao_channel="ao1", ai_channel="ai1",
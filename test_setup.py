@@ -53,27 +53,32 @@ def test_nidaqmx():
         print(f"\n✓ Found {len(devices)} device(s):\n")
         
         target_cards = ['SV1', 'SV2', 'SV3', 'SV4']
+        target_set = frozenset(target_cards)
         found_cards = []
         
-        for device in devices:
-            is_target = device.name in target_cards
+        # Each property read is a driver call, so query every device once
+        info = [(d.name, d.product_type, d.serial_num, len(d.ao_physical_chans))
+                for d in devices]
+        
+        for name, product_type, serial_num, ao_count in info:
+            is_target = name in target_set
             marker = "✓" if is_target else " "
             
-            print(f"{marker} Device: {device.name}")
-            print(f"  Product: {device.product_type}")
-            print(f"  Serial: {device.serial_num}")
-            print(f"  AO Channels: {len(device.ao_physical_chans)}")
+            print(f"{marker} Device: {name}")
+            print(f"  Product: {product_type}")
+            print(f"  Serial: {serial_num}")
+            print(f"  AO Channels: {ao_count}")
             
-            if "4468" in device.product_type:
+            if "4468" in product_type:
                 print(f"  → PXIe-4468 detected!")
             
             if is_target:
-                found_cards.append(device.name)
+                found_cards.append(name)
             
             print()
         
         # Check for target cards
-        missing_cards = set(target_cards) - set(found_cards)
+        missing_cards = target_set.difference(found_cards)
         
         if missing_cards:
             print("\n⚠ CONFIGURATION WARNING:")
@@ -115,20 +120,24 @@ def test_frequencies_csv():
     print(f"✓ File exists: {csv_path}")
     
     try:
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
+        with open(csv_path, 'r', newline='') as f:
+            reader = csv.reader(f)
             frequencies = []
             
+            # Resolve column positions once; rows are then plain lists
+            header = [name.strip() for name in next(reader)]
+            freq_col = header.index('Frequency')
+            name_col = header.index('Name') if 'Name' in header else None
+            flag_cols = [header.index(col) for col in ('Available', 'Enabled') if col in header]
+            
             for row in reader:
                 try:
-                    freq = float(row['Frequency'])
-                    name = row.get('Name', f"{freq} Hz")
-                    available = row.get('Available', '').strip().upper() == 'X'
-                    enabled = row.get('Enabled', '').strip().upper() == 'X'
+                    freq = float(row[freq_col])
+                    name = row[name_col] if name_col is not None else f"{freq} Hz"
                     
-                    if available or enabled:
+                    if any(row[col].strip().upper() == 'X' for col in flag_cols):
                         frequencies.append((freq, name))
-                except (ValueError, KeyError):
+                except (ValueError, IndexError):
                     continue
         
         print(f"✓ Loaded {len(frequencies)} available frequencies")